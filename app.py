@@ -1,173 +1,133 @@
 import streamlit as st
 import pandas as pd
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-import uvicorn
-import threading
-import sqlite3
 import numpy as np
-import matplotlib.pyplot as plt
-
-
-# SQLite persistent storage
-DB_PATH = "iot_data.db"
-
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    # Check if sensor_data table exists and has channelId column
-    c.execute("PRAGMA table_info(sensor_data)")
-    columns = [row[1] for row in c.fetchall()]
-    if 'channelId' not in columns:
-        c.execute("DROP TABLE IF EXISTS sensor_data")
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS channels (
-            channelId TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            fields TEXT NOT NULL -- comma separated field names
-        )
-    """)
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS sensor_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            channelId TEXT NOT NULL,
-            field TEXT NOT NULL,
-            value TEXT NOT NULL,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    conn.commit()
-    conn.close()
-
-def create_channel(channelId, name, fields):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    # Check for duplicate channelId
-    c.execute("SELECT channelId FROM channels WHERE channelId=?", (channelId,))
-    if c.fetchone():
-        conn.close()
-        return False, "Channel already exists"
-    c.execute("INSERT INTO channels (channelId, name, fields) VALUES (?, ?, ?)", (channelId, name, ','.join(fields)))
-    conn.commit()
-    conn.close()
-    return True, "Channel created"
-
-def get_channels():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT channelId, name, fields FROM channels")
-    rows = c.fetchall()
-    conn.close()
-    return rows
-
-def insert_data(channelId, data_list):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    # Validate channel exists
-    c.execute("SELECT fields FROM channels WHERE channelId=?", (channelId,))
-    row = c.fetchone()
-    if not row:
-        conn.close()
-        return False, "Channel does not exist"
-    allowed_fields = row[0].split(',')
-    for d in data_list:
-        if d["field"] not in allowed_fields:
-            conn.close()
-            return False, f"Field {d['field']} not allowed in channel {channelId}"
-        # Optionally validate data type here (e.g., float, int, str)
-    c.executemany(
-        "INSERT INTO sensor_data (channelId, field, value) VALUES (?, ?, ?)",
-        [ (channelId, d["field"], str(d["value"])) for d in data_list ]
+import threading
+import os
+import io
+import xlsxwriter  # preloaded so the first Excel export does not pay the import
+from functools import partial
+from db import create_channel, get_channels, fetch_data, fetch_pivoted, RESOLUTIONS, TIME_RANGES
+from iot_api import run_api
+from static_content import SENSORS_MD, COMPONENTS_MD, QUIZ_BANK, PROJECTS, RPI_GUIDE
+
+# Set IOT_EMBED_API=0 when the API is deployed as its own process (see iot_api.py)
+EMBED_API = os.environ.get("IOT_EMBED_API", "1") != "0"
+
+# Started once per process; Streamlit reruns would otherwise try to rebind the port
+@st.cache_resource
+def start_api():
+    api_thread = threading.Thread(target=run_api, daemon=True)
+    api_thread.start()
+    return api_thread
+
+if EMBED_API:
+    start_api()
+
+# Cached reads for the Streamlit script, which reruns on every interaction
+@st.cache_resource(ttl=30)
+def cached_channels():
+    # (rows, ids, names, fields) derived once from the channel rows; held as a
+    # shared resource so reruns neither re-query nor copy it
+    channels = get_channels()
+    return (
+        channels,
+        [c[0] for c in channels],
+        {c[0]: c[1] for c in channels},
+        {c[0]: c[2] for c in channels},
     )
-    conn.commit()
-    conn.close()
-    return True, "Data inserted"
-
-def fetch_data(channelId=None):
-    conn = sqlite3.connect(DB_PATH)
-    if channelId:
-        query = "SELECT channelId, field, value, timestamp FROM sensor_data WHERE channelId=? ORDER BY timestamp ASC"
-        df = pd.read_sql_query(query, conn, params=(channelId,))
-    else:
-        df = pd.read_sql_query("SELECT channelId, field, value, timestamp FROM sensor_data ORDER BY timestamp ASC", conn)
-    conn.close()
-    return df
-
-init_db()
-
-# FastAPI setup with rate limiting
-limiter = Limiter(key_func=get_remote_address)
-app = FastAPI()
-app.state.limiter = limiter
-
-
-# API to create a channel
-@app.post("/api/channel")
-async def api_create_channel(request: Request):
-    payload = await request.json()
-    channelId = payload.get("channelId")
-    name = payload.get("name")
-    fields = payload.get("fields")
-    if not channelId or not name or not fields or not isinstance(fields, list):
-        return JSONResponse({"error": "Missing or invalid channelId, name, or fields (must be a list)"}, status_code=400)
-    success, msg = create_channel(channelId, name, fields)
-    if not success:
-        return JSONResponse({"error": msg}, status_code=400)
-    return {"status": "success", "message": msg}
-
-# API to get channels
-@app.get("/api/channels")
-async def api_get_channels():
-    rows = get_channels()
-    return {"channels": [ {"channelId": r[0], "name": r[1], "fields": r[2].split(',')} for r in rows ]}
-
-
-# API to insert data via query params (GET for ESP8266/AT compatibility)
-from fastapi import Query
-@app.get("/api/data")
-@limiter.limit("50/minute")
-async def receive_data_query(
-    request: Request,
-    channelId: str = Query(...),
-    field1: str = Query(...),
-    value1: str = Query(...),
-    field2: str = Query(None),
-    value2: str = Query(None),
-    field3: str = Query(None),
-    value3: str = Query(None),
-    field4: str = Query(None),
-    value4: str = Query(None),
-    field5: str = Query(None),
-    value5: str = Query(None)
-):
-    # Support up to 5 fields per request
-    data_list = []
-    if field1 and value1:
-        data_list.append({"field": field1, "value": value1})
-    for f, v in zip([field2, field3, field4, field5], [value2, value3, value4, value5]):
-        if f is not None and v is not None:
-            data_list.append({"field": f, "value": v})
-    if not channelId or not data_list:
-        return JSONResponse({"error": "Missing channelId or data"}, status_code=400)
-    success, msg = insert_data(channelId, data_list)
-    if not success:
-        return JSONResponse({"error": msg}, status_code=400)
-    return {"status": "success", "message": msg, "count": len(data_list)}
-
-# API to get data by channelId
-@app.get("/api/data/{channelId}")
-async def api_get_data(channelId: str):
-    df = fetch_data(channelId)
-    return {"data": df.to_dict(orient="records")}
 
-# Run FastAPI in a separate thread
-def run_api():
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+@st.cache_data(ttl=5)
+def export_csv(channelId):
+    return fetch_data(channelId).to_csv(index=False)
 
-api_thread = threading.Thread(target=run_api, daemon=True)
-api_thread.start()
+@st.cache_data(ttl=5)
+def export_xlsx(channelId):
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter", engine_kwargs={"options": {"constant_memory": True}}) as writer:
+        fetch_data(channelId).to_excel(writer, index=False)
+    return buf.getvalue()
+
+@st.cache_data(ttl=5)
+def export_parquet(channelId):
+    df = fetch_data(channelId)
+    # Parquet needs one type per column: keep values numeric unless the
+    # channel has text readings too
+    numeric = pd.to_numeric(df["value"], errors="coerce")
+    df = df.assign(value=numeric if numeric.notna().sum() == df["value"].notna().sum() else df["value"].astype(str))
+    buf = io.BytesIO()
+    df.to_parquet(buf, index=False, compression="zstd")
+    return buf.getvalue()
+
+@st.cache_data(ttl=5)
+def cached_fetch_pivoted(channelId, fields, since, points):
+    return fetch_pivoted(channelId, fields, since, points)
+
+# Simulated step-response error curves for the PID page; constant, so they
+# are computed once per process and drawn with Streamlit's native chart
+@st.cache_data
+def pid_error_curves():
+    t = np.linspace(0, 5, 200)
+    return pd.DataFrame({
+        "Open Loop (No Controller)": np.exp(-0.5*t) * (1-np.exp(-2*t)),
+        "P Controller": np.exp(-1.2*t) * (1-np.exp(-2*t)),
+        "PI Controller": np.exp(-2*t) * (1-np.exp(-2*t/1.5)),
+        "PID Controller": np.exp(-3*t) * (1-np.exp(-2*t/1.2)),
+    }, index=pd.Index(t, name="Time (s)"))
+
+# Page bodies wrapped in fragments so their widgets rerun only that section
+@st.fragment
+def create_channel_section():
+    with st.form("create_channel_form"):
+        new_channel_id = st.text_input("Channel ID")
+        new_channel_name = st.text_input("Channel Name")
+        new_fields = st.text_area("Fields (comma separated, e.g. temperature,humidity,pressure)")
+        submitted = st.form_submit_button("Create Channel")
+        if submitted:
+            fields_list = [f.strip() for f in new_fields.split(",") if f.strip()]
+            if new_channel_id and new_channel_name and fields_list:
+                success, msg = create_channel(new_channel_id, new_channel_name, fields_list)
+                if success:
+                    cached_channels.clear()
+                    st.success(msg)
+                else:
+                    st.error(msg)
+            else:
+                st.error("Please provide all details.")
+    st.subheader("Existing Channels")
+    channels = cached_channels()[0]
+    for cid, name, fields in channels:
+        st.write(f"**ID:** {cid} | **Name:** {name} | **Fields:** {','.join(fields)}")
+
+@st.fragment
+def visualize_section():
+    if st.button("Refresh channels"):
+        cached_channels.clear()
+    _, channel_ids, channel_names, channel_fields = cached_channels()
+    selected_channel = st.selectbox("Select Channel", channel_ids, format_func=lambda x: f"{x} ({channel_names.get(x,'')})")
+    st.write(f"**Channel Name:** {channel_names.get(selected_channel,'')} | **Fields:** {', '.join(channel_fields.get(selected_channel,[]))}")
+    fields = channel_fields.get(selected_channel,[])
+    time_range = st.select_slider("Time range", options=list(TIME_RANGES), value="All")
+    resolution = st.selectbox("Resolution", list(RESOLUTIONS), index=1)
+    st.caption(f"Readings are averaged into at most {RESOLUTIONS[resolution]} points per field.")
+    pivot_df = cached_fetch_pivoted(selected_channel, tuple(fields), TIME_RANGES[time_range], RESOLUTIONS[resolution]) if fields else pd.DataFrame()
+    if not pivot_df.empty:
+        combine = st.multiselect("Select fields to combine in one graph", fields, default=fields[:1])
+        # Columns arrive already pivoted and sorted by timestamp
+        plotted = [f for f in fields if pivot_df[f].notna().any()]
+        for field in plotted:
+            st.subheader(f"Field: {field}")
+            st.line_chart(pivot_df[field].dropna(), use_container_width=True)
+        combined = [f for f in combine if f in plotted]
+        if len(combined) > 1:
+            st.subheader("Combined Graph")
+            st.line_chart(pivot_df[combined], use_container_width=True)
+        st.subheader("Export Data")
+        # Files are only built when a download button is clicked
+        st.download_button("Download CSV", partial(export_csv, selected_channel), file_name=f"{selected_channel}_data.csv", mime="text/csv")
+        st.download_button("Download Excel", partial(export_xlsx, selected_channel), file_name=f"{selected_channel}_data.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+        st.download_button("Download Parquet", partial(export_parquet, selected_channel), file_name=f"{selected_channel}_data.parquet", mime="application/vnd.apache.parquet")
+    else:
+        st.info("No data for selected channel.")
 
 # Streamlit UI with navigation
 st.set_page_config(page_title="IoT Data Dashboard", layout="wide")
@@ -211,34 +171,12 @@ menu = st.sidebar.radio(
 
 )
 
-channels = get_channels()
-channel_ids = [c[0] for c in channels]
-channel_names = {c[0]: c[1] for c in channels}
-channel_fields = {c[0]: c[2].split(',') for c in channels}
 
-# --- Navigation Logic ---
-if menu == "Create Channel":
+def page_create_channel():
     st.header("Create a Channel")
-    with st.form("create_channel_form_main"):
-        new_channel_id = st.text_input("Channel ID")
-        new_channel_name = st.text_input("Channel Name")
-        new_fields = st.text_area("Fields (comma separated, e.g. temperature,humidity,pressure)")
-        submitted = st.form_submit_button("Create Channel")
-        if submitted:
-            fields_list = [f.strip() for f in new_fields.split(",") if f.strip()]
-            if new_channel_id and new_channel_name and fields_list:
-                success, msg = create_channel(new_channel_id, new_channel_name, fields_list)
-                if success:
-                    st.success(msg)
-                else:
-                    st.error(msg)
-            else:
-                st.error("Please provide all details.")
-    st.subheader("Existing Channels")
-    for cid, name, fields in channels:
-        st.write(f"**ID:** {cid} | **Name:** {name} | **Fields:** {fields}")
+    create_channel_section()
 
-elif menu == "Motor Control & PID Integration":
+def page_motor_control_pid_integration():
     st.header("DC Motor Control with Arduino: P, PI, PID Optimization")
     st.markdown('''
     This page explains how to control a DC motor with Arduino and optimize its response using P, PI, and PID controllers. You can visualize the error signal before and after applying each controller.
@@ -285,22 +223,7 @@ elif menu == "Motor Control & PID Integration":
     ''')
     st.subheader("Error Signal Visualization (Simulated)")
     st.markdown("Below: Simulated error response for a step input with no controller, P, PI, and PID controllers.")
-    # Simulate error signals
-    t = np.linspace(0, 5, 200)
-    error_open = np.exp(-0.5*t) * (1-np.exp(-2*t))
-    error_p = np.exp(-1.2*t) * (1-np.exp(-2*t))
-    error_pi = np.exp(-2*t) * (1-np.exp(-2*t/1.5))
-    error_pid = np.exp(-3*t) * (1-np.exp(-2*t/1.2))
-    fig, ax = plt.subplots()
-    ax.plot(t, error_open, label="Open Loop (No Controller)")
-    ax.plot(t, error_p, label="P Controller")
-    ax.plot(t, error_pi, label="PI Controller")
-    ax.plot(t, error_pid, label="PID Controller")
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Error")
-    ax.set_title("Error Signal Before/After Controller")
-    ax.legend()
-    st.pyplot(fig)
+    st.line_chart(pid_error_curves(), x_label="Time (s)", y_label="Error")
     st.markdown("""
     **Interpretation:**
     - **Open Loop:** Error decays slowly, steady-state error remains.
@@ -314,7 +237,7 @@ elif menu == "Motor Control & PID Integration":
     - For real hardware, use a sensor for feedback and plot error in Python/Excel.
     """)
 
-elif menu == "Serial Read from Serial Monitor":
+def page_serial_read_from_serial_monitor():
     st.header("Reading Data from Arduino Serial Monitor")
     st.markdown("""
     This page explains how to read data from Arduino using the Serial Monitor, including a full code example and usage tips.
@@ -365,7 +288,7 @@ elif menu == "Serial Read from Serial Monitor":
     For more, see [Arduino Serial Reference](https://www.arduino.cc/reference/en/language/functions/communication/serial/).
     """)
 
-elif menu == "Arduino Control System Mimic":
+def page_arduino_control_system_mimic():
     st.header("Arduino-Based Control System: Multi-Sensor Integration & Mimic")
     st.markdown("""
     This page demonstrates how to use Arduino to mimic a control system using multiple sensors (e.g., temperature, light, distance) and actuators (motors, LEDs, buzzers).
@@ -428,81 +351,31 @@ elif menu == "Arduino Control System Mimic":
     - Simulate control logic in Python for learning
     """, unsafe_allow_html=True)
 
-channels = get_channels()
-channel_ids = [c[0] for c in channels]
-channel_names = {c[0]: c[1] for c in channels}
-channel_fields = {c[0]: c[2].split(',') for c in channels}
-
-
-if menu == "Create Channel":
-    st.header("Create a Channel")
-    with st.form("create_channel_form_sidebar"):
-        new_channel_id = st.text_input("Channel ID")
-        new_channel_name = st.text_input("Channel Name")
-        new_fields = st.text_area("Fields (comma separated, e.g. temperature,humidity,pressure)")
-        submitted = st.form_submit_button("Create Channel")
-        if submitted:
-            fields_list = [f.strip() for f in new_fields.split(",") if f.strip()]
-            if new_channel_id and new_channel_name and fields_list:
-                success, msg = create_channel(new_channel_id, new_channel_name, fields_list)
-                if success:
-                    st.success(msg)
-                else:
-                    st.error(msg)
-            else:
-                st.error("Please provide all details.")
-    st.subheader("Existing Channels")
-    for cid, name, fields in channels:
-        st.write(f"**ID:** {cid} | **Name:** {name} | **Fields:** {fields}")
-
-elif menu == "Visualize & Export Data":
+def page_visualize_export_data():
     st.header("Data Visualization & Export")
-    selected_channel = st.selectbox("Select Channel", channel_ids, format_func=lambda x: f"{x} ({channel_names.get(x,'')})")
-    st.write(f"**Channel Name:** {channel_names.get(selected_channel,'')} | **Fields:** {', '.join(channel_fields.get(selected_channel,[]))}")
-    vis_df = fetch_data(selected_channel)
-    if not vis_df.empty:
-        fields = channel_fields.get(selected_channel,[])
-        combine = st.multiselect("Select fields to combine in one graph", fields, default=fields[:1])
-        for field in fields:
-            field_df = vis_df[vis_df['field'] == field].sort_values("timestamp")
-            try:
-                field_df['value'] = field_df['value'].astype(float)
-            except:
-                pass
-            st.subheader(f"Field: {field}")
-            st.line_chart(field_df.set_index("timestamp")["value"], use_container_width=True)
-        if len(combine) > 1:
-            st.subheader("Combined Graph")
-            combined_df = vis_df[vis_df['field'].isin(combine)].copy()
-            try:
-                combined_df['value'] = combined_df['value'].astype(float)
-            except:
-                pass
-            pivot_df = combined_df.pivot(index="timestamp", columns="field", values="value")
-            st.line_chart(pivot_df, use_container_width=True)
-        import io
-        st.subheader("Export Data")
-        st.download_button("Download CSV", vis_df.to_csv(index=False), file_name=f"{selected_channel}_data.csv", mime="text/csv")
-        excel_buffer = io.BytesIO()
-        vis_df.to_excel(excel_buffer, index=False)
-        st.download_button("Download Excel", excel_buffer.getvalue(), file_name=f"{selected_channel}_data.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
-    else:
-        st.info("No data for selected channel.")
+    visualize_section()
 
     st.markdown("""
     **API Endpoints:**
     - Create Channel: `/api/channel` (POST)
         - JSON: `{ "channelId": "ch1", "name": "Room1", "fields": ["temperature", "humidity"] }`
     - List Channels: `/api/channels` (GET)
-    - Insert Data: `/api/data` (POST)
-        - JSON: `{ "channelId": "ch1", "data": [ { "field": "temperature", "value": 25.5 }, ... ] }`
+    - Insert Data: `/api/data` (GET)
+        - Query: `?channelId=ch1&fields=temperature,humidity&values=25.5,40`
+        - Legacy query: `?channelId=ch1&field1=temperature&value1=25.5&field2=humidity&value2=40` (up to 5 fields)
+    - Insert Batch: `/api/data/batch` (POST)
+        - JSON: `{ "channelId": "ch1", "rows": [{ "field": "temperature", "value": 25.5, "ts": 1718000000000 }] }`
+        - `ts` (epoch milliseconds, not seconds) is optional; it must be no more than 5 minutes ahead of the
+          server clock or 30 days behind it (`IOT_TS_MAX_AGE_DAYS`); send 100-1000 rows per request, at most 5000
     - Get Data: `/api/data/{channelId}` (GET)
     
-    Rate limit: 5 requests/minute per IP
+    Rate limits: 50 requests/minute per device and channel, counted across `/api/data` and
+    `/api/data/batch` together (300/minute per IP across both and all channels),
+    10 requests/minute per IP on `/api/channel`
     Data is stored persistently in SQLite (`iot_data.db`).
     """)
 
-elif menu == "Arduino Code Cheatsheet":
+def page_arduino_code_cheatsheet():
     st.header("Arduino Code Cheatsheet: Analog & Digital IO")
     st.markdown("""
 **Analog Input:**
@@ -527,277 +400,48 @@ digitalWrite(13, LOW);  // Sets pin 13 LOW
 ```
     """)
 
-elif menu == "Sensors & Components":
+def page_sensors_components():
     st.header("Sensors & Components for Arduino")
     st.markdown("### Common Sensors:")
-    # CSS/HTML circuit diagrams for each sensor
-    sensor_diagrams = {
-        "DHT11/DHT22 Temperature & Humidity Sensor": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <div style="width:80px;height:80px;position:relative;background:#e0f7fa;border-radius:10px;border:2px solid #0097a7;">
-    <div style="position:absolute;left:35px;top=0;width:10px;height:80px;background:#607d8b;"></div>
-    <div style="position:absolute;left:0;top:35px;width:80px;height:10px;background:#607d8b;"></div>
-    <div style="position:absolute;left:38px;top:38px;width:4px;height:4px;background:#0097a7;border-radius:50%;"></div>
-    <div style="position:absolute;left:10px;top:70px;width:60px;height:6px;background:#0097a7;border-radius:3px;"></div>
-  </div>
-  <div>DHT11/DHT22 Sensor<br><span style='font-size:12px;color:#555;'>3-pin, digital output</span></div>
-</div>
-''',
-        "LDR (Light Dependent Resistor)": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="60">
-    <rect x="10" y="20" width="60" height="20" rx="8" fill="#fffde7" stroke="#fbc02d" stroke-width="3"/>
-    <line x1="0" y1="30" x2="10" y2="30" stroke="#616161" stroke-width="2"/>
-    <line x1="70" y1="30" x2="80" y2="30" stroke="#616161" stroke-width="2"/>
-    <line x1="20" y1="20" x2="60" y2="40" stroke="#fbc02d" stroke-width="2"/>
-    <line x1="20" y1="40" x2="60" y2="20" stroke="#fbc02d" stroke-width="2"/>
-  </svg>
-  <div>LDR Sensor<br><span style='font-size:12px;color:#555;'>Light dependent resistor</span></div>
-</div>
-''',
-        "Ultrasonic Sensor (HC-SR04)": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="90" height="60">
-    <rect x="10" y="10" width="70" height="40" rx="8" fill="#e3f2fd" stroke="#1976d2" stroke-width="2"/>
-    <circle cx="30" cy="30" r="10" fill="#fff" stroke="#1976d2" stroke-width="2"/>
-    <circle cx="60" cy="30" r="10" fill="#fff" stroke="#1976d2" stroke-width="2"/>
-    <rect x="40" y="50" width="10" height="10" fill="#1976d2"/>
-  </svg>
-  <div>HC-SR04 Ultrasonic<br><span style='font-size:12px;color:#555;'>Trig/Echo pins</span></div>
-</div>
-''',
-        "IR Sensor": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="60">
-    <rect x="20" y="10" width="40" height="40" rx="8" fill="#f3e5f5" stroke="#7b1fa2" stroke-width="2"/>
-    <ellipse cx="40" cy="30" rx="10" ry="18" fill="#fff" stroke="#7b1fa2" stroke-width="2"/>
-    <rect x="36" y="48" width="8" height="10" fill="#7b1fa2"/>
-  </svg>
-  <div>IR Sensor<br><span style='font-size:12px;color:#555;'>Reflective/Obstacle</span></div>
-</div>
-''',
-        "Soil Moisture Sensor": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="60">
-    <rect x="30" y="10" width="20" height="40" rx="6" fill="#e8f5e9" stroke="#388e3c" stroke-width="2"/>
-    <rect x="36" y="50" width="8" height="10" fill="#388e3c"/>
-    <rect x="36" y="0" width="8" height="10" fill="#388e3c"/>
-    <rect x="30" y="25" width="20" height="10" fill="#a5d6a7"/>
-  </svg>
-  <div>Soil Moisture Sensor<br><span style='font-size:12px;color:#555;'>Analog output</span></div>
-</div>
-''',
-        "MQ-2 Gas Sensor": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="60">
-    <rect x="20" y="10" width="40" height="40" rx="10" fill="#fff3e0" stroke="#f57c00" stroke-width="2"/>
-    <circle cx="40" cy="30" r="12" fill="#fff" stroke="#f57c00" stroke-width="2"/>
-    <rect x="36" y="48" width="8" height="10" fill="#f57c00"/>
-  </svg>
-  <div>MQ-2 Gas Sensor<br><span style='font-size:12px;color:#555;'>Analog/Digital output</span></div>
-</div>
-''',
-    }
-    sensors = [
-        {"name": "DHT11/DHT22 Temperature & Humidity Sensor", "use": "Measure temperature and humidity", "application": "Weather stations, greenhouses"},
-        {"name": "LDR (Light Dependent Resistor)", "use": "Detect light intensity", "application": "Automatic lighting, light meters"},
-        {"name": "Ultrasonic Sensor (HC-SR04)", "use": "Measure distance", "application": "Obstacle avoidance, level measurement"},
-        {"name": "IR Sensor", "use": "Detect objects, proximity", "application": "Line following robots, object counters"},
-        {"name": "Soil Moisture Sensor", "use": "Measure soil moisture", "application": "Smart irrigation"},
-        {"name": "MQ-2 Gas Sensor", "use": "Detect gas leaks", "application": "Safety, air quality monitoring"},
-    ]
-    for s in sensors:
-        st.markdown(sensor_diagrams[s["name"]], unsafe_allow_html=True)
-        st.write(f"**{s['name']}**  ")
-        st.write(f"Use: {s['use']}")
-        st.write(f"Application: {s['application']}")
-        st.markdown("---")
+    st.markdown(SENSORS_MD, unsafe_allow_html=True)
 
     st.markdown("### Common Components:")
-    # CSS/HTML circuit diagrams for each component
-    component_diagrams = {
-        "Breadboard": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="100" height="40">
-    <rect x="5" y="5" width="90" height="30" rx="6" fill="#fff" stroke="#607d8b" stroke-width="2"/>
-    <rect x="10" y="10" width="80" height="20" fill="#b0bec5"/>
-    <rect x="10" y="15" width="80" height="10" fill="#fff"/>
-    <circle cx="20" cy="20" r="2" fill="#607d8b"/>
-    <circle cx="30" cy="20" r="2" fill="#607d8b"/>
-    <circle cx="40" cy="20" r="2" fill="#607d8b"/>
-    <circle cx="50" cy="20" r="2" fill="#607d8b"/>
-    <circle cx="60" cy="20" r="2" fill="#607d8b"/>
-    <circle cx="70" cy="20" r="2" fill="#607d8b"/>
-    <circle cx="80" cy="20" r="2" fill="#607d8b"/>
-    <circle cx="90" cy="20" r="2" fill="#607d8b"/>
-  </svg>
-  <div>Breadboard</div>
-</div>
-''',
-        "Jumper Wires": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="40">
-    <line x1="10" y1="10" x2="70" y2="30" stroke="#388e3c" stroke-width="4"/>
-    <circle cx="10" cy="10" r="4" fill="#388e3c"/>
-    <circle cx="70" cy="30" r="4" fill="#388e3c"/>
-  </svg>
-  <div>Jumper Wires</div>
-</div>
-''',
-        "Resistors": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="40">
-    <line x1="0" y1="20" x2="20" y2="20" stroke="#616161" stroke-width="2"/>
-    <rect x="20" y="12" width="40" height="16" rx="6" fill="#fffde7" stroke="#fbc02d" stroke-width="2"/>
-    <line x1="60" y1="20" x2="80" y2="20" stroke="#616161" stroke-width="2"/>
-    <rect x="35" y="16" width="10" height="8" fill="#fbc02d"/>
-  </svg>
-  <div>Resistor</div>
-</div>
-''',
-        "Capacitors": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="40">
-    <line x1="10" y1="20" x2="30" y2="20" stroke="#616161" stroke-width="2"/>
-    <rect x="30" y="10" width="8" height="20" fill="#bdbdbd"/>
-    <rect x="42" y="10" width="8" height="20" fill="#bdbdbd"/>
-    <line x1="50" y1="20" x2="70" y2="20" stroke="#616161" stroke-width="2"/>
-  </svg>
-  <div>Capacitor</div>
-</div>
-''',
-        "Push Button": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="60" height="60">
-    <rect x="10" y="20" width="40" height="20" rx="6" fill="#fff" stroke="#607d8b" stroke-width="2"/>
-    <circle cx="30" cy="30" r="8" fill="#90caf9" stroke="#1976d2" stroke-width="2"/>
-  </svg>
-  <div>Push Button</div>
-</div>
-''',
-        "LED": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="60" height="60">
-    <rect x="25" y="40" width="10" height="15" fill="#616161"/>
-    <circle cx="30" cy="30" r="12" fill="#f44336" stroke="#b71c1c" stroke-width="2"/>
-    <rect x="27" y="20" width="6" height="10" fill="#fff"/>
-  </svg>
-  <div>LED</div>
-</div>
-''',
-        "Potentiometer": '''
-<div style="display:flex;align-items:center;gap:16px;">
-  <svg width="80" height="40">
-    <rect x="30" y="10" width="20" height="20" rx="6" fill="#fffde7" stroke="#fbc02d" stroke-width="2"/>
-    <circle cx="40" cy="20" r="6" fill="#bdbdbd" stroke="#616161" stroke-width="2"/>
-    <rect x="38" y="0" width="4" height="10" fill="#616161"/>
-  </svg>
-  <div>Potentiometer</div>
-</div>
-''',
-    }
-    components = [
-        {"name": "Breadboard", "use": "Prototyping circuits", "application": "All Arduino projects"},
-        {"name": "Jumper Wires", "use": "Connect components", "application": "All Arduino projects"},
-        {"name": "Resistors", "use": "Limit current", "application": "LEDs, sensors"},
-        {"name": "Capacitors", "use": "Store charge, filter signals", "application": "Power supply, signal filtering"},
-        {"name": "Push Button", "use": "User input", "application": "Switches, user interfaces"},
-        {"name": "LED", "use": "Visual indicator", "application": "Status, output"},
-        {"name": "Potentiometer", "use": "Variable resistor", "application": "Volume control, sensor calibration"},
-    ]
-    for c in components:
-        st.markdown(component_diagrams[c["name"]], unsafe_allow_html=True)
-        st.write(f"**{c['name']}**  ")
-        st.write(f"Use: {c['use']}")
-        st.write(f"Application: {c['application']}")
-        st.markdown("---")
+    st.markdown(COMPONENTS_MD, unsafe_allow_html=True)
 
 
-elif menu == "Arduino Quiz":
+def page_arduino_quiz():
 
     import random
+    from array import array
     st.header("Arduino Quiz")
     st.info("Click the 'New Quiz' button below to get a new set of questions. Once you submit, your answers and results will remain visible until you click 'New Quiz'.")
 
-    # 25 sets of 20 realistic Arduino questions each
-    question_bank = [
-        # Set 1
-        [
-            {"question": "What is the function of 'pinMode(13, OUTPUT);' in Arduino?", "options": ["Sets pin 13 as input", "Sets pin 13 as output", "Reads analog value from pin 13", "Enables PWM on pin 13"], "answer": 1},
-            {"question": "Which Arduino function is used to read a digital input?", "options": ["digitalWrite()", "analogRead()", "digitalRead()", "pinMode()"], "answer": 2},
-            {"question": "What voltage is considered HIGH on most Arduino digital pins?", "options": ["0V", "1.1V", "3.3V", "5V"], "answer": 3},
-            {"question": "Which function sends data to the Serial Monitor?", "options": ["Serial.print()", "Serial.begin()", "Serial.read()", "Serial.write()"], "answer": 0},
-            {"question": "What is the default baud rate for Serial communication in Arduino examples?", "options": ["4800", "9600", "115200", "19200"], "answer": 1},
-            {"question": "Which pin is typically used for onboard LED on Arduino Uno?", "options": ["7", "10", "13", "A0"], "answer": 2},
-            {"question": "What does 'analogRead(A0)' return?", "options": ["A voltage value", "A value between 0-1023", "A value between 0-255", "A boolean value"], "answer": 1},
-            {"question": "Which function is used to generate PWM output?", "options": ["analogRead()", "analogWrite()", "digitalWrite()", "tone()"], "answer": 1},
-            {"question": "What is the purpose of a pull-down resistor?", "options": ["To keep pin HIGH by default", "To keep pin LOW by default", "To limit current to LED", "To filter analog signals"], "answer": 1},
-            {"question": "Which sensor is best for measuring temperature?", "options": ["LDR", "DHT11", "HC-SR04", "MQ-2"], "answer": 1},
-            {"question": "What is the use of 'delay(1000);' in Arduino code?", "options": ["Repeat code 1000 times", "Pause for 1 second", "Set pin 1000 HIGH", "Start timer"], "answer": 1},
-            {"question": "Which command initializes serial communication?", "options": ["Serial.begin(9600);", "Serial.print(9600);", "Serial.init(9600);", "Serial.start(9600);"], "answer": 0},
-            {"question": "What is the range of values for analogWrite()?", "options": ["0-1023", "0-255", "0-1", "0-4095"], "answer": 1},
-            {"question": "Which function is called only once in a sketch?", "options": ["loop()", "setup()", "main()", "start()"], "answer": 1},
-            {"question": "What does 'digitalRead(2)' return if the button is pressed and connected to GND?", "options": ["HIGH", "LOW", "1", "Error"], "answer": 1},
-            {"question": "Which sensor is used for distance measurement?", "options": ["DHT11", "HC-SR04", "LDR", "BMP180"], "answer": 1},
-            {"question": "What is the use of a breadboard?", "options": ["Permanent soldering", "Prototyping circuits", "Programming Arduino", "Power supply"], "answer": 1},
-            {"question": "Which function is used to set a pin HIGH or LOW?", "options": ["digitalWrite()", "digitalRead()", "analogWrite()", "pinMode()"], "answer": 0},
-            {"question": "What is the output of 'Serial.println(123);'?", "options": ["123", "'123'", "Serial error", "Nothing"], "answer": 0},
-            {"question": "Which component is used to limit current in a circuit?", "options": ["Capacitor", "Resistor", "Inductor", "Transistor"], "answer": 1},
-        ],
-        # Set 2
-        [
-            {"question": "Which function is used to read analog values?", "options": ["analogRead()", "digitalRead()", "analogWrite()", "readAnalog()"], "answer": 0},
-            {"question": "What is the maximum value returned by analogRead() on Uno?", "options": ["255", "1023", "4095", "65535"], "answer": 1},
-            {"question": "Which command sets pin 8 as input?", "options": ["pinMode(8, INPUT);", "digitalRead(8);", "digitalWrite(8, INPUT);", "setPin(8, INPUT);"], "answer": 0},
-            {"question": "What is the use of 'Serial.available()'?", "options": ["Send data", "Check if data is available to read", "Clear serial buffer", "Set baud rate"], "answer": 1},
-            {"question": "Which sensor detects light?", "options": ["LDR", "DHT11", "HC-SR04", "Relay"], "answer": 0},
-            {"question": "What is the output voltage of Arduino Uno digital HIGH?", "options": ["0V", "3.3V", "5V", "12V"], "answer": 2},
-            {"question": "Which function is used to output text to serial monitor?", "options": ["Serial.print()", "Serial.read()", "Serial.input()", "Serial.write()"], "answer": 0},
-            {"question": "What is the use of a relay module?", "options": ["Measure temperature", "Switch high voltage devices", "Detect light", "Generate sound"], "answer": 1},
-            {"question": "Which pin is PWM capable on Uno?", "options": ["2", "3", "4", "5V"], "answer": 1},
-            {"question": "What is the use of 'tone()' function?", "options": ["Generate sound", "Read analog value", "Set pin mode", "Send serial data"], "answer": 0},
-            {"question": "Which sensor is used for gas detection?", "options": ["LDR", "MQ-2", "DHT11", "BMP180"], "answer": 1},
-            {"question": "What is the use of 'noTone()' function?", "options": ["Stop sound on pin", "Start PWM", "Read digital pin", "Set pin as output"], "answer": 0},
-            {"question": "Which function is used to start the main program?", "options": ["main()", "setup()", "loop()", "start()"], "answer": 1},
-            {"question": "What is the use of a potentiometer?", "options": ["Measure temperature", "Adjust resistance", "Detect light", "Switch relay"], "answer": 1},
-            {"question": "Which command turns on an LED on pin 9?", "options": ["digitalWrite(9, HIGH);", "digitalRead(9);", "analogWrite(9, HIGH);", "pinMode(9, OUTPUT);"], "answer": 0},
-            {"question": "What is the use of 'millis()' in Arduino?", "options": ["Delay program", "Return time since program started", "Set timer", "Reset Arduino"], "answer": 1},
-            {"question": "Which function is used to read serial data?", "options": ["Serial.read()", "Serial.print()", "Serial.begin()", "Serial.write()"], "answer": 0},
-            {"question": "What is the use of a jumper wire?", "options": ["Connect components", "Measure voltage", "Store charge", "Switch relay"], "answer": 0},
-            {"question": "Which sensor is used for humidity measurement?", "options": ["DHT11", "LDR", "HC-SR04", "MQ-2"], "answer": 0},
-            {"question": "What is the use of a capacitor?", "options": ["Store charge", "Limit current", "Switch relay", "Detect light"], "answer": 0},
-        ],
-        # Sets 3-25: For brevity, repeat set 1 and 2, but in production, fill with more unique questions
-    ]
-    # Fill up to 25 sets
-    while len(question_bank) < 25:
-        question_bank.append(question_bank[len(question_bank)%2])
-
-    # Session state for quiz persistence
-    if 'quiz_set' not in st.session_state:
-        st.session_state.quiz_set = random.choice(question_bank).copy()
-        random.shuffle(st.session_state.quiz_set)
+    question_bank = QUIZ_BANK
+
+    # Session state for quiz persistence: the chosen set is shared with the
+    # bank, each session only keeps its own question order and the option
+    # index picked for each question (-1 until submitted)
+    if 'quiz_order' not in st.session_state:
+        st.session_state.quiz_base = random.choice(question_bank)
+        st.session_state.quiz_order = random.sample(range(len(st.session_state.quiz_base)), len(st.session_state.quiz_base))
         st.session_state.quiz_submitted = False
-        st.session_state.quiz_answers = [None]*len(st.session_state.quiz_set)
+        st.session_state.quiz_answers = array('b', [-1]*len(st.session_state.quiz_base))
 
     # New Quiz button (visible above the form)
     if st.button('New Quiz'):
-        st.session_state.quiz_set = random.choice(question_bank).copy()
-        random.shuffle(st.session_state.quiz_set)
+        st.session_state.quiz_base = random.choice(question_bank)
+        st.session_state.quiz_order = random.sample(range(len(st.session_state.quiz_base)), len(st.session_state.quiz_base))
         st.session_state.quiz_submitted = False
-        st.session_state.quiz_answers = [None]*len(st.session_state.quiz_set)
+        st.session_state.quiz_answers = array('b', [-1]*len(st.session_state.quiz_base))
 
-    quiz_set = st.session_state.quiz_set
+    quiz_base = st.session_state.quiz_base
     quiz_form = st.form("quiz_form")
-    user_answers = []
-    for idx, q in enumerate(quiz_set):
-        if st.session_state.quiz_submitted:
-            # Show selected answer as disabled radio
-            user_answers.append(st.session_state.quiz_answers[idx])
-            quiz_form.radio(q["question"], q["options"], key=f"q{idx}", index=q["options"].index(st.session_state.quiz_answers[idx]) if st.session_state.quiz_answers[idx] in q["options"] else 0, disabled=True)
-        else:
-            ans = quiz_form.radio(q["question"], q["options"], key=f"q{idx}", index=q["options"].index(st.session_state.quiz_answers[idx]) if st.session_state.quiz_answers[idx] in q["options"] else 0 if st.session_state.quiz_answers[idx] else 0)
-            user_answers.append(ans)
+    user_answers = array('b')
+    for idx, qi in enumerate(st.session_state.quiz_order):
+        q = quiz_base[qi]
+        # Once submitted the radio is disabled and shows the saved answer
+        ans = quiz_form.radio(q.question, q.options, key=f"q{idx}", index=max(st.session_state.quiz_answers[idx], 0), disabled=st.session_state.quiz_submitted)
+        user_answers.append(q.option_index[ans])
     submitted = quiz_form.form_submit_button("Submit Quiz")
     if submitted and not st.session_state.quiz_submitted:
         st.session_state.quiz_submitted = True
@@ -806,59 +450,24 @@ elif menu == "Arduino Quiz":
     if st.session_state.quiz_submitted:
         st.subheader("Results:")
         score = 0
-        for idx, q in enumerate(quiz_set):
-            correct = q["options"][q["answer"]]
-            user = st.session_state.quiz_answers[idx]
-            if user == correct:
-                st.success(f"Q{idx+1}: Correct! {q['question']}")
+        for idx, qi in enumerate(st.session_state.quiz_order):
+            q = quiz_base[qi]
+            if st.session_state.quiz_answers[idx] == q.answer:
+                st.success(f"Q{idx+1}: Correct! {q.question}")
                 score += 1
             else:
-                st.error(f"Q{idx+1}: Wrong. {q['question']} (Correct: {correct})")
+                st.error(f"Q{idx+1}: Wrong. {q.question} (Correct: {q.correct})")
         st.info(f"Your Score: {score} / 20")
 
-elif menu == "Arduino Projects":
+def page_arduino_projects():
     st.header("Common Real-time Arduino Projects & Steps")
-    projects = [
-        {"name": "Automatic Plant Watering System", "steps": [
-            "Connect soil moisture sensor to Arduino.",
-            "Connect relay module to control water pump.",
-            "Write code to read soil moisture and activate pump when dry.",
-            "Test and calibrate the system.",
-            "Enclose electronics for safety."
-        ]},
-        {"name": "Home Automation with IR Remote", "steps": [
-            "Connect IR receiver to Arduino.",
-            "Connect relays to control appliances.",
-            "Decode IR remote signals.",
-            "Map remote buttons to appliance control.",
-            "Test with different appliances."
-        ]},
-        {"name": "Weather Station", "steps": [
-            "Connect DHT11/DHT22 sensor for temperature/humidity.",
-            "Connect LCD display for output.",
-            "Write code to read sensor and display data.",
-            "Add data logging to SD card (optional)."
-        ]},
-        {"name": "Obstacle Avoidance Robot", "steps": [
-            "Connect ultrasonic sensor and motors.",
-            "Write code to measure distance and control motors.",
-            "Test robot movement and avoidance logic.",
-            "Tune speed and turning for best results."
-        ]},
-        {"name": "Smart Door Lock", "steps": [
-            "Connect keypad and servo motor to Arduino.",
-            "Write code to read keypad and control servo.",
-            "Set up password logic.",
-            "Test locking/unlocking with correct/incorrect codes."
-        ]},
-    ]
-    for p in projects:
+    for p in PROJECTS:
         st.subheader(p["name"])
         for idx, step in enumerate(p["steps"]):
             st.write(f"Step {idx+1}: {step}")
         st.markdown("---")
 
-elif menu == "Flex/MQ2/Color Sensor Integration":
+def page_flex_mq2_color_sensor_integration():
     st.header("Flex, MQ2 Gas, and Color Sensor Integration with Arduino")
     st.markdown("""
     ### 1. Flex Sensor Integration
@@ -961,7 +570,7 @@ elif menu == "Flex/MQ2/Color Sensor Integration":
     **Integration Points:** Use the RGB values to detect color and trigger actions (sorting, color-based logic).
     """)
 
-elif menu == "DHT Sensor Integration":
+def page_dht_sensor_integration():
     st.header("DHT11/DHT22 Sensor Integration with Arduino Uno (Tinkercad & IDE)")
     st.markdown("""
     ### 1. Circuit Diagram (Tinkercad/Real)
@@ -1008,7 +617,7 @@ elif menu == "DHT Sensor Integration":
     **Note:** For DHT22, change `#define DHTTYPE DHT22` and wiring is the same.
     """)
 
-elif menu == "Arduino Tutorials Blog":
+def page_arduino_tutorials_blog():
     st.header("Arduino Tutorials Blog")
     st.markdown("""
     ### Getting Started with Arduino
@@ -1034,7 +643,7 @@ elif menu == "Arduino Tutorials Blog":
     """)
 
 # --- Ultrasonic Sensor Guide Page ---
-elif menu == "Ultrasonic Sensor Guide":
+def page_ultrasonic_sensor_guide():
     st.header("Ultrasonic Sensor (HC-SR04) Working & Arduino Integration")
     st.image("https://components101.com/sites/default/files/component_images/HC-SR04-Ultrasonic-Sensor.png", width=200)
     st.markdown("""
@@ -1068,7 +677,7 @@ elif menu == "Ultrasonic Sensor Guide":
     """)
 
 # --- L293D Motor Driver Guide Page ---
-elif menu == "L293D Motor Driver Guide":
+def page_l293d_motor_driver_guide():
     st.header("L293D Motor Driver: Working & Arduino Integration")
     st.image("https://components101.com/sites/default/files/component_images/L293D-IC.png", width=200)
     st.markdown("""
@@ -1102,7 +711,7 @@ elif menu == "L293D Motor Driver Guide":
     """)
 
 # --- Sensor Working & Integration Page ---
-elif menu == "Sensor Working & Integration":
+def page_sensor_working_integration():
     st.header("Sensor Working Principles & Arduino Integration")
     st.markdown("""
     #### DHT11/DHT22 (Temperature & Humidity)
@@ -1129,7 +738,7 @@ elif menu == "Sensor Working & Integration":
     """)
 
 # --- Arduino Boards Comparison Page ---
-elif menu == "Arduino Boards Comparison":
+def page_arduino_boards_comparison():
     st.header("Arduino Boards & NodeMCU Comparison")
     st.markdown("""
     | Board         | MCU         | Voltage | IO Pins | Comm | Special Features         |
@@ -1152,7 +761,7 @@ elif menu == "Arduino Boards Comparison":
     """)
 
 # --- Arduino Concepts Page ---
-elif menu == "Arduino Concepts":
+def page_arduino_concepts():
     st.header("Core Arduino Concepts")
     st.markdown("""
     - **Interrupts:** Pause main code to handle events (attachInterrupt, ISR).
@@ -1172,7 +781,7 @@ elif menu == "Arduino Concepts":
     """)
 
 # --- Starter Codes & Programming Page ---
-elif menu == "Starter Codes & Programming":
+def page_starter_codes_programming():
     st.header("Starter Codes & Arduino Programming")
     st.markdown("""
     **Blink LED:**
@@ -1199,7 +808,7 @@ elif menu == "Starter Codes & Programming":
     """)
 
 # --- Electronics Concepts Page ---
-elif menu == "Electronics Concepts":
+def page_electronics_concepts():
     st.header("Electronics Concepts for Arduino & Circuits")
     st.markdown("""
     - **GND & VCC:** Ground and supply voltage.
@@ -1216,7 +825,7 @@ elif menu == "Electronics Concepts":
     """)
 
 # --- Serial Protocols (SPI/I2C/UART) Page ---
-elif menu == "Serial Protocols (SPI/I2C/UART)":
+def page_serial_protocols_spi_i2c_uart():
     st.header("Serial Protocols: SPI, I2C, UART")
     st.markdown("""
     | Protocol | Wires | Speed      | Addressing | Use Case                |
@@ -1242,7 +851,7 @@ elif menu == "Serial Protocols (SPI/I2C/UART)":
     """)
 
 # --- Common Mistakes & Best Practices Page ---
-elif menu == "Common Mistakes & Best Practices":
+def page_common_mistakes_best_practices():
     st.header("Common Mistakes, Dos & Don'ts (Arduino & Electronics)")
     st.markdown("""
     - Not using current limiting resistors for LEDs.
@@ -1261,7 +870,7 @@ elif menu == "Common Mistakes & Best Practices":
     """)
 
 # --- Productization Steps Page ---
-elif menu == "Productization Steps":
+def page_productization_steps():
     st.header("Converting Arduino Project to Product: Steps")
     st.markdown("""
     1. **Prototype:** Build and test on breadboard.
@@ -1277,7 +886,7 @@ elif menu == "Productization Steps":
     """)
 
 # --- Applications & Advanced Projects Page ---
-elif menu == "Applications & Advanced Projects":
+def page_applications_advanced_projects():
     st.header("Applications & Advanced Arduino Projects")
     st.markdown("""
     - **Image Processing:** Use Arduino with camera modules (limited), or interface with Raspberry Pi for advanced vision.
@@ -1293,334 +902,13 @@ elif menu == "Applications & Advanced Projects":
     """)
 
 # --- Raspberry Pi Full Guide Page ---
-elif menu == "Raspberry Pi Full Guide":
+def page_raspberry_pi_full_guide():
     st.header("Raspberry Pi From Scratch – Sensors, IoT, Image Processing & Projects")
-    sections = [
-        "Agenda",
-        "Hardware Overview",
-        "Version Comparison",
-        "Flash the OS",
-        "First Login & Updates",
-        "Essential Linux Commands",
-        "Python Environment",
-        "GPIO Numbering",
-        "Safer Abstraction: gpiozero",
-        "Digital Output (Blink LED)",
-        "Digital Input (Button)",
-        "Edge Detection + Debounce",
-        "PWM (LED Fading)",
-        "Servo Control",
-        "Analog Inputs (MCP3008/ADS1115)",
-        "I2C Sensor (BME280)",
-        "UART Basics",
-        "PLC & PID Control",
-        "IoT & MQTT Integration",
-        "Image Processing (OpenCV)",
-        "Mini Projects",
-        "Cheat Sheet & Helper Snippets",
-        "Best Practices / Do & Don'ts",
-        "Troubleshooting & Resources"
-    ]
-    section = st.selectbox("Section", sections)
-    if section == "Agenda":
-        st.markdown("""
-1. Hardware & OS Setup
-2. Linux & GPIO Fundamentals
-3. Digital I/O & Timing
-4. Analog Sensing (MCP3008 / ADS1115)
-5. Buses: I2C, SPI, UART
-6. PWM, Servo & Control
-7. Raspberry Pi as PLC & PID Control
-8. IoT & MQTT Integration
-9. Image Processing (OpenCV Focus)
-10. Mini Projects & Ideas
-11. Cheat Sheet & Helper Snippets
-12. Best Practices / Do & Don'ts
-13. Model/Version Comparison
-14. Troubleshooting & Resources
-        """)
-    elif section == "Hardware Overview":
-        st.markdown("""
-**Typical Kit:**
-- Raspberry Pi 3 Model B/B+
-- microSD (>=16GB, Class 10)
-- 5V 2.5A PSU
-- HDMI cable / headless setup
-- Breadboard, GPIO ribbon (optional)
-- LEDs, buttons, resistors (220Ω, 10kΩ)
-- Sensors: DHT22, BME280, HC-SR04, LDR, MCP3008 ADC, servo, camera module, PIR
-        """)
-    elif section == "Version Comparison":
-        st.markdown("""
-| Feature | Pi 3B+ | Pi 4 | Pi 5 |
-|---------|--------|------|------|
-| CPU | 1.4GHz Quad Cortex-A53 | 1.5GHz Cortex-A72 | 2.4GHz Cortex-A76 | 
-| RAM | 1GB | 2–8GB | 4–8GB |
-| USB | 4x2.0 | 2x2.0 + 2x3.0 | 2x2.0 + 2x3.0 |
-| Video | 1080p | Dual 4K | Dual 4K (better) |
-| M.2 (direct) | No | No | Via PCIe FPC |
-| Power | 5V microUSB | 5V USB-C | 5V USB-C (PD) |
-| Ideal Use | Learning, light IoT | Desktop, heavier ML | High perf + vision |
-
-Notes: Code examples identical across versions unless performance-critical.
-        """)
-    elif section == "Flash the OS":
-        st.markdown("""
-1. Download Raspberry Pi Imager (rpi-imager)
-2. Choose Raspberry Pi OS (Lite for headless, Full for desktop)
-3. Configure (Ctrl+Shift+X): hostname, SSH, Wi-Fi, locale
-4. Flash & insert microSD
-5. Power on; find IP via router or `raspberrypi.local`
-        """)
-    elif section == "First Login & Updates":
-        st.markdown("""
-```bash
-ssh pi@raspberrypi.local       # default user 'pi'
-passwd                         # change password
-sudo apt update && sudo apt full-upgrade -y
-sudo raspi-config              # enable: SSH, I2C, SPI, Camera, Serial
-```
-        """)
-    elif section == "Essential Linux Commands":
-        st.markdown("""
-```bash
-ls, cd, pwd, mkdir, rm -r, cp, mv
-nano file.py        # quick edit
-sudo systemctl status <svc>
-free -h; df -h      # memory & disk
-vcgencmd measure_temp
-htop                # install: sudo apt install -y htop
-```
-        """)
-    elif section == "Python Environment":
-        st.markdown("""
-**Setting Up Python on Raspberry Pi:**
-- Python 3 is pre-installed on Raspberry Pi OS.
-- Use `python3` and `pip3` for running scripts and installing packages.
-- Recommended: Create a virtual environment for projects.
-```bash
-sudo apt install python3-pip python3-venv
-python3 -m venv myenv
-source myenv/bin/activate
-```
-Install libraries: `pip3 install numpy pandas matplotlib gpiozero`
-        """)
-    elif section == "GPIO Numbering":
-        st.markdown("""
-**GPIO Numbering on Raspberry Pi:**
-- Two numbering schemes: BOARD (physical pin numbers) and BCM (Broadcom SoC numbering).
-- Most libraries (RPi.GPIO, gpiozero) use BCM by default.
-```python
-import RPi.GPIO as GPIO
-GPIO.setmode(GPIO.BCM)  # or GPIO.BOARD
-
-```
-Refer to a GPIO pinout diagram for your Pi model.
-        """)
-    elif section == "Safer Abstraction: gpiozero":
-        st.markdown("""
-**gpiozero Library:**
-- High-level Python library for controlling GPIO devices easily.
-- Handles setup/cleanup and errors for you.
-```python
-from gpiozero import LED, Button
-led = LED(18)
-button = Button(17)
-led.on()
-button.when_pressed = led.toggle
-```
-See: https://gpiozero.readthedocs.io/
-        """)
-    elif section == "Digital Output (Blink LED)":
-        st.markdown("""
-**Blinking an LED (Python):**
-```python
-import RPi.GPIO as GPIO
-import time
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(18, GPIO.OUT)
-for i in range(10):
-    GPIO.output(18, GPIO.HIGH)
-    time.sleep(0.5)
-    GPIO.output(18, GPIO.LOW)
-    time.sleep(0.5)
-GPIO.cleanup()
-```
-        """)
-    elif section == "Digital Input (Button)":
-        st.markdown("""
-**Reading a Button (Python):**
-```python
-import RPi.GPIO as GPIO
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(17, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-if GPIO.input(17):
-    print("Button not pressed")
-else:
-    print("Button pressed")
-GPIO.cleanup()
-```
-        """)
-    elif section == "Edge Detection + Debounce":
-        st.markdown("""
-**Edge Detection & Debouncing:**
-- Use GPIO event detection to respond to button presses/releases.
-- Debouncing prevents false triggers from noisy signals.
-```python
-import RPi.GPIO as GPIO
-def callback(channel):
-    print("Button event!")
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(17, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-GPIO.add_event_detect(17, GPIO.FALLING, callback=callback, bouncetime=200)
-```
-        """)
-    elif section == "PWM (LED Fading)":
-        st.markdown("""
-**PWM for LED Fading:**
-```python
-import RPi.GPIO as GPIO
-import time
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(18, GPIO.OUT)
-pwm = GPIO.PWM(18, 1000)
-pwm.start(0)
-for dc in range(0, 101, 5):
-    pwm.ChangeDutyCycle(dc)
-    time.sleep(0.05)
-pwm.stop()
-GPIO.cleanup()
-```
-        """)
-    elif section == "Servo Control":
-        st.markdown("""
-**Controlling a Servo Motor:**
-```python
-from gpiozero import Servo
-from time import sleep
-servo = Servo(17)
-servo.min()
-sleep(1)
-servo.max()
-sleep(1)
-```
-        """)
-    elif section == "Analog Inputs (MCP3008/ADS1115)":
-        st.markdown("""
-**Reading Analog Sensors (MCP3008/ADS1115):**
-- Use SPI/I2C ADC chips to read analog sensors.
-```python
-import spidev
-spi = spidev.SpiDev()
-spi.open(0,0)
-def read_adc(ch):
-    r = spi.xfer2([1, (8+ch)<<4, 0])
-    return ((r[1]&3)<<8) + r[2]
-val = read_adc(0)
-print(val)
-```
-        """)
-    elif section == "I2C Sensor (BME280)":
-        st.markdown("""
-**Reading I2C Sensors (BME280):**
-```python
-import smbus2
-bus = smbus2.SMBus(1)
-addr = 0x76
-chip_id = bus.read_byte_data(addr, 0xD0)
-print(f"Chip ID: {chip_id}")
-```
-        """)
-    elif section == "UART Basics":
-        st.markdown("""
-**UART Serial Communication:**
-- Use `/dev/serial0` for UART on Pi.
-```python
-import serial
-ser = serial.Serial('/dev/serial0', 9600)
-ser.write(b'Hello Pi')
-data = ser.readline()
-print(data)
-ser.close()
-```
-        """)
-    elif section == "PLC & PID Control":
-        st.markdown("""
-**PLC & PID Control on Pi:**
-- Use Python for simple PLC logic and PID control.
-- Libraries: `simple-pid`, `pylogix` (for PLC comms)
-```python
-from simple_pid import PID
-pid = PID(1, 0.1, 0.05, setpoint=20)
-output = pid(18)  # Example process variable
-print(output)
-```
-        """)
-    elif section == "IoT & MQTT Integration":
-        st.markdown("""
-**IoT & MQTT Integration:**
-- Use `paho-mqtt` for MQTT communication.
-```python
-import paho.mqtt.client as mqtt
-client = mqtt.Client()
-client.connect('broker.hivemq.com', 1883)
-client.publish('test/topic', 'Hello from Pi')
-client.disconnect()
-```
-        """)
-    elif section == "Image Processing (OpenCV)":
-        st.markdown("""
-**Image Processing with OpenCV:**
-```python
-import cv2
-img = cv2.imread('image.jpg')
-gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-cv2.imshow('Gray', gray)
-cv2.waitKey(0)
-cv2.destroyAllWindows()
-```
-        """)
-    elif section == "Mini Projects":
-        st.markdown("""
-**Mini Project Ideas:**
-- Temperature logger with BME280
-- Motion-activated camera
-- Home automation with relays
-- IoT weather station
-        """)
-    elif section == "Cheat Sheet & Helper Snippets":
-        st.markdown("""
-**Cheat Sheet & Helper Snippets:**
-- See the 'Starters & Cheatsheet' page for quick code.
-- Use `gpiozero` for easy device control.
-- Use `crontab` for scheduled tasks.
-        """)
-    elif section == "Best Practices / Do & Don'ts":
-        st.markdown("""
-**Best Practices:**
-- Always shut down Pi safely (`sudo shutdown -h now`).
-- Use resistors with LEDs.
-- Avoid powering motors directly from Pi.
-- Use virtual environments for Python projects.
-**Do & Don'ts:**
-- Do: Backup SD card, keep system updated.
-- Don't: Pull power without shutdown, short GPIO pins.
-        """)
-    elif section == "Troubleshooting & Resources":
-        st.markdown("""
-**Troubleshooting:**
-- Pi won't boot: Check power, SD card, HDMI.
-- No network: Check Wi-Fi config, try Ethernet.
-- GPIO errors: Check pin numbering, permissions.
-**Resources:**
-- Official docs: https://www.raspberrypi.com/documentation/
-- Forums: https://forums.raspberrypi.com/
-- Pinout: https://pinout.xyz/
-        """)
-    # ...continue for each section, splitting your markdown content as needed...
+    section = st.selectbox("Section", list(RPI_GUIDE))
+    st.markdown(RPI_GUIDE[section])
 
 # --- Raspberry Pi Starters & Cheatsheet Page ---
-elif menu == "Raspberry Pi Starters & Cheatsheet":
+def page_raspberry_pi_starters_cheatsheet():
     st.header("Raspberry Pi Starters & Python Cheatsheet")
     st.markdown("""
 **Getting Started:**
@@ -1652,11 +940,16 @@ else:
 import spidev
 spi = spidev.SpiDev()
 spi.open(0,0)
+spi.max_speed_hz = 1350000  # MCP3008 limit at 3.3V; the driver default is far higher
 def read_adc(ch):
     r = spi.xfer2([1, (8+ch)<<4, 0])
     return ((r[1]&3)<<8) + r[2]
+def read_all():
+    # one 3-byte transfer per channel: each conversion needs CS raised and
+    # lowered again, so the frames can't share one CS-held transfer
+    return [read_adc(ch) for ch in range(8)]
 val = read_adc(0)
-print(val)
+print(val, read_all())
 ```
 
 **Useful Commands:**
@@ -1668,22 +961,29 @@ print(val)
     """)
 
 # --- Raspberry Pi Sensor Integrations Page ---
-elif menu == "Raspberry Pi Sensor Integrations":
+def page_raspberry_pi_sensor_integrations():
     st.header("Raspberry Pi Sensor Integrations & Scenarios")
     st.markdown("""
 **Digital Sensor Example (PIR Motion):**
+Edge callbacks from the pigpio daemon instead of polling: no busy loop, no
+missed edges between polls, and each event carries a microsecond timestamp.
+Start the daemon first with `sudo systemctl enable --now pigpiod`
+(pigpio doesn't support the Pi 5; use gpiozero's `MotionSensor` there).
 ```python
-import RPi.GPIO as GPIO
-import time
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(23, GPIO.IN)
+import pigpio
+from signal import pause
+PIR = 23
+pi = pigpio.pi()
+pi.set_mode(PIR, pigpio.INPUT)
+pi.set_glitch_filter(PIR, 10000)  # ignore pulses under 10 ms, filtered in pigpiod
+def motion(gpio, level, tick):
+    print("Motion detected!", tick)  # tick: edge time in microseconds
+cb = pi.callback(PIR, pigpio.RISING_EDGE, motion)
 try:
-    while True:
-        if GPIO.input(23):
-            print("Motion detected!")
-        time.sleep(0.1)
+    pause()
 finally:
-    GPIO.cleanup()
+    cb.cancel()
+    pi.stop()
 ```
 
 **Analog Sensor Example (MCP3008 + Potentiometer):**
@@ -1703,9 +1003,29 @@ print(f"Chip ID: {chip_id}")
 **Scenario: Integrating Both Analog & Digital Sensors**
 - Use MCP3008 for analog sensors, direct GPIO for digital.
 - Read both in the same loop, log to file or send to cloud.
+- Log into preallocated NumPy columns (one array per signal) rather than a list of
+  dicts per sample: about 11 bytes per sample instead of a few hundred, and the
+  whole run is saved in one call.
+```python
+import time
+import numpy as np
+import pigpio
+# read_adc() from the MCP3008 example in the cheatsheet
+N = 100_000
+t_ns = np.empty(N, dtype=np.int64)
+adc = np.empty(N, dtype=np.uint16)
+pir = np.empty(N, dtype=np.bool_)
+pi = pigpio.pi()
+for i in range(N):
+    t_ns[i] = time.perf_counter_ns()
+    adc[i] = read_adc(0)
+    pir[i] = pi.read(23)
+    time.sleep(0.001)
+np.savez_compressed('log.npz', t_ns=t_ns, adc=adc, pir=pir)
+```
     """)
 
-elif menu == "Raspberry Pi GPS Sensor Integration (I2C)":
+def page_raspberry_pi_gps_sensor_integration_i2c():
     st.header("Raspberry Pi GPS Sensor Integration (I2C)")
     st.markdown('''
 This page shows how to integrate a GPS module that supports I2C (for example, some u-blox modules or Adafruit breakout boards with I2C support).
@@ -1727,22 +1047,50 @@ sudo raspi-config
 # Interfacing Options -> I2C -> Enable
 sudo reboot
 ```
+Optionally raise the I2C clock from the default 100 kHz to 400 kHz (u-blox DDC
+supports Fast Mode), so each NMEA read takes about a quarter of the bus time:
+```bash
+sudo sh -c 'echo "dtparam=i2c_arm_baudrate=400000" >> /boot/firmware/config.txt'   # /boot/config.txt on older images
+sudo reboot
+od -An -tu4 --endian=big /sys/class/i2c-adapter/i2c-1/of_node/clock-frequency    # verify: 400000
+```
 Confirm device appears:
 ```bash
 i2cdetect -y 1
 # Typical u-blox I2C address: 0x42
 ```
 
+Shared helper: save it as `i2c_gps.py` next to the scripts on this page, which
+all import `read_pending()` from it:
+```python
+# i2c_gps.py - drain the u-blox DDC (I2C) output buffer
+import smbus2
+
+GPS_ADDR = 0x42  # common for u-blox
+MAX_READ = 255
+
+def read_pending(bus):
+    # bytes waiting in the module (registers 0xFD/0xFE, high byte first)
+    hi, lo = bus.read_i2c_block_data(GPS_ADDR, 0xFD, 2)
+    n = min((hi << 8) | lo, MAX_READ)
+    if not n:
+        return b''
+    # point at the data stream register 0xFF and read all n bytes in one
+    # transfer, instead of 32-byte SMBus blocks
+    write, read = smbus2.i2c_msg.write(GPS_ADDR, [0xFF]), smbus2.i2c_msg.read(GPS_ADDR, n)
+    bus.i2c_rdwr(write, read)
+    return bytes(read)
+```
+
 Simple I2C read example (reads raw NMEA bytes exposed over I2C):
 ```python
 import time
 try:
     import smbus2
+    from i2c_gps import MAX_READ, read_pending
 except Exception:
     smbus2 = None
 
-GPS_ADDR = 0x42  # common for u-blox
-
 def read_raw_i2c():
     if smbus2 is None:
         print('Install smbus2: pip3 install smbus2')
@@ -1751,18 +1099,38 @@ def read_raw_i2c():
     buffer = bytearray()
     try:
         while True:
-            # read block; adjust length if needed
-            data = bus.read_i2c_block_data(GPS_ADDR, 0xFF, 32)
-            for b in data:
-                if b == 0:
-                    continue
-                buffer.append(b)
-                if b == 0x0A:  # newline -> likely end of NMEA sentence
-                    line = buffer.decode(errors='ignore').strip()
-                    buffer.clear()
-                    if line.startswith('$'):
-                        print(line)
-            time.sleep(0.1)
+            data = read_pending(bus)
+            buffer.extend(data)
+            # slice out every complete line (newline ends an NMEA sentence)
+            while (nl := buffer.find(0x0A)) >= 0:
+                line = buffer[:nl].decode(errors='ignore').strip()
+                del buffer[:nl + 1]
+                if line.startswith('$'):
+                    print(line)
+            # keep reading while the module has a backlog, otherwise poll
+            time.sleep(0 if len(data) == MAX_READ else 0.05)
+    except KeyboardInterrupt:
+        pass
+
+# Event-driven variant: wire the module's TX-ready output to GPIO5 and enable
+# it for I2C (u-blox M9/M10: CFG_TXREADY_ENABLED=1, CFG_TXREADY_INTERFACE=0,
+# CFG_TXREADY_PIN=<PIO>, CFG_TXREADY_THRESHOLD=1), then read only when the
+# module says data is waiting instead of waking up on a timer
+def read_raw_i2c_txready(pin=5):
+    from gpiozero import DigitalInputDevice
+    txready = DigitalInputDevice(pin)
+    bus = smbus2.SMBus(1)
+    buffer = bytearray()
+    try:
+        while True:
+            if not txready.wait_for_active(timeout=1):
+                continue
+            buffer.extend(read_pending(bus))
+            while (nl := buffer.find(0x0A)) >= 0:
+                line = buffer[:nl].decode(errors='ignore').strip()
+                del buffer[:nl + 1]
+                if line.startswith('$'):
+                    print(line)
     except KeyboardInterrupt:
         pass
 
@@ -1781,73 +1149,206 @@ def parse_with_pynmea2(line):
             st.write(repr(msg))
     except Exception as e:
         st.write('Parse error:', e)
-        
-st.subheader('Quick demo (read raw NMEA over I2C)')
-if st.button('Start I2C Read (console output)'):
-    st.write('This will run in your console where Streamlit was started; use the example script locally on the Pi for live reads.')
-    st.write('See code example above: use read_raw_i2c() in a separate script or a Python REPL on the Pi.')
+```
+''')
 
-st.markdown(```
+    st.subheader('Quick demo (read raw NMEA over I2C)')
+    if st.button('Start I2C Read (console output)'):
+        st.write('This will run in your console where Streamlit was started; use the example script locally on the Pi for live reads.')
+        st.write('See code example above: use read_raw_i2c() in a separate script or a Python REPL on the Pi.')
+
+    st.markdown('''
 Advanced: u-blox UBX parsing (binary) and configuration
 - Use `pyubx2` to send UBX messages and parse binary protocols.
 - Many modules allow switching between UART/I2C and configuring update rate, nav settings, etc.
+- A UBX-NAV-PVT fix is one 100-byte binary frame with integer/float fields, against
+  several hundred bytes of ASCII NMEA sentences that have to be tokenized, so
+  switching the I2C output to UBX cuts both bus traffic and parsing work.
 ''')
+    st.code('''
+#!/usr/bin/env python3
+# i2c_gps_ubx.py - UBX-NAV-PVT at 10 Hz over I2C with pyubx2 (M9/M10 and newer)
+import smbus2, time
+from pyubx2 import UBXReader, UBXMessage, UBX_PROTOCOL, SET_LAYER_RAM, TXN_NONE
+from i2c_gps import GPS_ADDR, read_pending
+
+class I2CStream:
+    # file-like wrapper so UBXReader can pull bytes off the I2C buffer
+    def __init__(self, bus):
+        self.bus = bus
+        self.buf = bytearray()
+
+    def fill(self):
+        data = read_pending(self.bus)
+        if not data:
+            time.sleep(0.01)
+        self.buf.extend(data)
+
+    def read(self, n=1):
+        while len(self.buf) < n:
+            self.fill()
+        out = bytes(self.buf[:n])
+        del self.buf[:n]
+        return out
+
+    def readline(self):
+        # UBXReader reads the rest of any NMEA sentence it meets with
+        # readline(), even with protfilter=UBX_PROTOCOL, e.g. sentences still
+        # queued from before the config below took effect
+        while (nl := self.buf.find(0x0A)) < 0:
+            self.fill()
+        return self.read(nl + 1)
+
+bus = smbus2.SMBus(1)
+# UBX only on I2C, NAV-PVT every measurement, 100 ms measurement rate (RAM layer)
+cfg = UBXMessage.config_set(SET_LAYER_RAM, TXN_NONE, [
+    ("CFG_I2COUTPROT_NMEA", 0),
+    ("CFG_I2COUTPROT_UBX", 1),
+    ("CFG_MSGOUT_UBX_NAV_PVT_I2C", 1),
+    ("CFG_RATE_MEAS", 100),
+])
+bus.i2c_rdwr(smbus2.i2c_msg.write(GPS_ADDR, list(cfg.serialize())))
+
+ubr = UBXReader(I2CStream(bus), protfilter=UBX_PROTOCOL)
+try:
+    while True:
+        raw, msg = ubr.read()
+        if msg is not None and msg.identity == "NAV-PVT":
+            print(msg.iTOW, msg.fixType, msg.numSV, msg.lat, msg.lon)
+except KeyboardInterrupt:
+    pass
+''', language='python')
+    st.markdown('If you only need the position fields, NAV-PVT can be decoded without pyubx2: `struct` unpacks the fixed-layout payload in one C call. Replace the reader loop above with:')
+    st.code('''
+import struct
+
+# NAV-PVT payload (92 bytes): iTOW, skip date/time/accuracy, fixType, flags,
+# flags2, numSV, lon, lat, height, hMSL (1e-7 deg / mm), hAcc, vAcc (mm)
+PVT = struct.Struct('<I16xBBBBiiiiII')
+HEADER = bytes([0xB5, 0x62, 0x01, 0x07, 92, 0])  # sync, class/id, length
+
+def read_nav_pvt(stream):
+    window = bytearray(stream.read(6))
+    while window != HEADER:
+        del window[0]
+        window += stream.read(1)
+    payload = stream.read(92)
+    ck_a = ck_b = 0
+    for x in HEADER[2:] + payload:  # 8-bit Fletcher over class..payload
+        ck_a = (ck_a + x) & 0xFF
+        ck_b = (ck_b + ck_a) & 0xFF
+    if stream.read(2) != bytes([ck_a, ck_b]):
+        return None
+    return PVT.unpack_from(payload, 0)
+
+stream = I2CStream(bus)
+try:
+    while True:
+        pvt = read_nav_pvt(stream)
+        if pvt is not None:
+            iTOW, fixType, flags, flags2, numSV, lon, lat, height, hMSL, hAcc, vAcc = pvt
+            print(iTOW, fixType, numSV, lat * 1e-7, lon * 1e-7)
+except KeyboardInterrupt:
+    pass
+''', language='python')
 
-st.subheader('Standalone example scripts to copy to your Pi')
-st.code('''import smbus2, time
+    st.subheader('Standalone example scripts to copy to your Pi')
+    st.code('''import smbus2, time
+from i2c_gps import MAX_READ, read_pending
 
-GPS_ADDR = 0x42
 bus = smbus2.SMBus(1)
 buf = bytearray()
 try:
     while True:
-        data = bus.read_i2c_block_data(GPS_ADDR, 0xFF, 32)
-        for b in data:
-            if b == 0: continue
-            buf.append(b)
-            if b == 0x0A:
-                line = buf.decode(errors='ignore').strip()
-                buf.clear()
-                if line.startswith('$'):
-                    print(line)
-        time.sleep(0.1)
+        data = read_pending(bus)
+        buf.extend(data)
+        while (nl := buf.find(0x0A)) >= 0:
+            line = buf[:nl].decode(errors='ignore').strip()
+            del buf[:nl + 1]
+            if line.startswith('$'):
+                print(line)
+        time.sleep(0 if len(data) == MAX_READ else 0.05)
 except KeyboardInterrupt:
     pass
 ''', language='python')
 
-st.code('''
+    st.code('''
 #!/usr/bin/env python3
 # i2c_gps_parse.py - read + parse with pynmea2
 import smbus2, time
 import pynmea2
+from i2c_gps import MAX_READ, read_pending
 
-GPS_ADDR = 0x42
 bus = smbus2.SMBus(1)
 buf = bytearray()
 try:
     while True:
-        data = bus.read_i2c_block_data(GPS_ADDR, 0xFF, 32)
-        for b in data:
-            if b == 0: continue
-            buf.append(b)
-            if b == 0x0A:
-                line = buf.decode(errors='ignore').strip()
-                buf.clear()
-                if line.startswith('$'):
-                    try:
-                        msg = pynmea2.parse(line)
-                        if hasattr(msg, 'latitude'):
-                            print('Lat:', msg.latitude, 'Lon:', msg.longitude)
-                        else:
-                            print(repr(msg))
-                    except Exception:
-                        print('parse error for', line)
-        time.sleep(0.1)
+        data = read_pending(bus)
+        buf.extend(data)
+        while (nl := buf.find(0x0A)) >= 0:
+            line = buf[:nl].decode(errors='ignore').strip()
+            del buf[:nl + 1]
+            if line.startswith('$'):
+                try:
+                    msg = pynmea2.parse(line)
+                    if hasattr(msg, 'latitude'):
+                        print('Lat:', msg.latitude, 'Lon:', msg.longitude)
+                    else:
+                        print(repr(msg))
+                except Exception:
+                    print('parse error for', line)
+        time.sleep(0 if len(data) == MAX_READ else 0.05)
 except KeyboardInterrupt:
     pass
 ''', language='python')
 
-st.markdown('''
+    st.markdown('For high poll rates, smbus2 builds its ctypes message objects on every call. This small cffi wrapper (`pip3 install cffi`, no compiler needed) preallocates the I2C_RDWR request once and issues each register read as a single ioctl:')
+    st.code('''
+# i2c_fast.py - preallocated write-register + repeated-start read via I2C_RDWR
+import os
+from cffi import FFI
+
+ffi = FFI()
+ffi.cdef("""
+struct i2c_msg { uint16_t addr; uint16_t flags; uint16_t len; uint8_t *buf; };
+struct i2c_rdwr_ioctl_data { struct i2c_msg *msgs; uint32_t nmsgs; };
+int ioctl(int fd, unsigned long request, ...);
+""")
+C = ffi.dlopen(None)
+I2C_RDWR = 0x0707
+I2C_M_RD = 0x0001
+
+class I2CDevice:
+    def __init__(self, bus, addr, max_len=255):
+        self.fd = os.open(f"/dev/i2c-{bus}", os.O_RDWR)
+        self.max_len = max_len
+        self.reg = ffi.new("uint8_t[1]")
+        self.buf = ffi.new("uint8_t[]", max_len)
+        self.msgs = ffi.new("struct i2c_msg[2]")
+        self.msgs[0].addr = self.msgs[1].addr = addr
+        self.msgs[0].len, self.msgs[0].buf = 1, self.reg
+        self.msgs[1].flags, self.msgs[1].buf = I2C_M_RD, self.buf
+        self.req = ffi.new("struct i2c_rdwr_ioctl_data *", {"msgs": self.msgs, "nmsgs": 2})
+
+    def read_block(self, reg, n):
+        self.reg[0] = reg
+        self.msgs[1].len = min(n, self.max_len)
+        if C.ioctl(self.fd, I2C_RDWR, self.req) < 0:
+            raise OSError(ffi.errno, os.strerror(ffi.errno))
+        return ffi.buffer(self.buf, self.msgs[1].len)[:]
+
+    def close(self):
+        os.close(self.fd)
+
+# GPS: the pending count, then exactly that many bytes from the data stream
+# register, as read_pending() in i2c_gps.py
+gps = I2CDevice(1, 0x42)
+count = gps.read_block(0xFD, 2)
+n = min((count[0] << 8) | count[1], 255)
+data = gps.read_block(0xFF, n) if n else b''
+''', language='python')
+
+    st.markdown('''
 Notes & Troubleshooting:
 - If you get no data, verify I2C address with `i2cdetect -y 1`.
 - Some modules default to UART; consult the module datasheet to enable I2C or use the UART pins (/dev/serial0) instead.
@@ -1855,3 +1356,36 @@ Notes & Troubleshooting:
 ''')
 
 # End of GPS section
+
+# --- Navigation Logic ---
+# Only the selected page function runs
+PAGES = {
+    "Create Channel": page_create_channel,
+    "Motor Control & PID Integration": page_motor_control_pid_integration,
+    "Serial Read from Serial Monitor": page_serial_read_from_serial_monitor,
+    "Arduino Control System Mimic": page_arduino_control_system_mimic,
+    "Visualize & Export Data": page_visualize_export_data,
+    "Arduino Code Cheatsheet": page_arduino_code_cheatsheet,
+    "Sensors & Components": page_sensors_components,
+    "Arduino Quiz": page_arduino_quiz,
+    "Arduino Projects": page_arduino_projects,
+    "Flex/MQ2/Color Sensor Integration": page_flex_mq2_color_sensor_integration,
+    "DHT Sensor Integration": page_dht_sensor_integration,
+    "Arduino Tutorials Blog": page_arduino_tutorials_blog,
+    "Ultrasonic Sensor Guide": page_ultrasonic_sensor_guide,
+    "L293D Motor Driver Guide": page_l293d_motor_driver_guide,
+    "Sensor Working & Integration": page_sensor_working_integration,
+    "Arduino Boards Comparison": page_arduino_boards_comparison,
+    "Arduino Concepts": page_arduino_concepts,
+    "Starter Codes & Programming": page_starter_codes_programming,
+    "Electronics Concepts": page_electronics_concepts,
+    "Serial Protocols (SPI/I2C/UART)": page_serial_protocols_spi_i2c_uart,
+    "Common Mistakes & Best Practices": page_common_mistakes_best_practices,
+    "Productization Steps": page_productization_steps,
+    "Applications & Advanced Projects": page_applications_advanced_projects,
+    "Raspberry Pi Full Guide": page_raspberry_pi_full_guide,
+    "Raspberry Pi Starters & Cheatsheet": page_raspberry_pi_starters_cheatsheet,
+    "Raspberry Pi Sensor Integrations": page_raspberry_pi_sensor_integrations,
+    "Raspberry Pi GPS Sensor Integration (I2C)": page_raspberry_pi_gps_sensor_integration_i2c,
+}
+PAGES[menu]()
@@ -0,0 +1,356 @@
+# SQLite storage shared by the ingest API (iot_api.py) and the dashboard (app.py)
+import math
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from collections import deque, OrderedDict
+from itertools import chain, groupby, islice
+from operator import itemgetter
+import pandas as pd
+
+# SQLite persistent storage
+DB_PATH = "iot_data.db"
+
+# Per-connection tuning; journal_mode=WAL is persistent and set once in init_db
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=10000",
+    "PRAGMA journal_size_limit=67108864",
+)
+
+INSERT_STMT = "INSERT INTO sensor_data (channelId, field, value_num, value_text, ts) VALUES (?, ?, ?, ?, ?)"
+# Multi-row form for bulk ingest: as many 5-column rows as fit under SQLite's
+# default 999 bound-parameter limit
+MULTI_INSERT_ROWS = 999 // 5
+MULTI_INSERT_STMT = INSERT_STMT + ", (?, ?, ?, ?, ?)" * (MULTI_INSERT_ROWS - 1)
+CHANNEL_STMT = "SELECT field FROM channel_fields WHERE channelId=?"
+DATA_QUERY = "SELECT channelId, field, COALESCE(value_num, value_text) AS value, datetime(ts / 1000, 'unixepoch') AS timestamp FROM sensor_data"
+DATA_COLUMNS = ["channelId", "field", "value", "timestamp"]
+CHANNEL_FIELD_STMT = "INSERT OR IGNORE INTO channel_fields (channelId, field) VALUES (?, ?)"
+STATEMENT_CACHE_SIZE = 512
+# Seconds a write waits on another process's lock before "database is locked"
+BUSY_TIMEOUT = 10.0
+
+# Visualisation bounds: points per field for each chart resolution and
+# selectable time windows
+RESOLUTIONS = {"Low": 500, "Medium": 2000, "High": 5000}
+TIME_RANGES = {"Last 1h": 3600, "Last 24h": 24 * 3600, "Last 7d": 7 * 24 * 3600, "All": None}
+
+# Ingest buffer: /api/data appends rows, the API's flusher task commits them
+# in batches of up to FLUSH_MAX_ROWS
+_BUFFER = deque()
+FLUSH_MAX_ROWS = 1000
+
+# channelId -> frozenset of allowed field names, preloaded after init_db() and
+# kept current by create_channel(); allowed_fields() falls back to the table
+_ALLOWED_FIELDS = {}
+
+# channelId -> monotonic expiry for channels found not to exist, so repeated
+# requests for an unknown channel don't each query SQLite; short-lived so a
+# channel created by another API process is picked up soon after
+_MISSING_CHANNELS = {}
+MISSING_TTL = 5.0
+MISSING_CACHE_SIZE = 10_000
+
+# fetch_data results for the most recently used channels: channelId -> (max id, DataFrame).
+# Callers get a copy, so changing a returned frame in place can't alter the cache
+_DF_CACHE = OrderedDict()
+DF_CACHE_SIZE = 8
+
+def connect(shared=False, readonly=False):
+    if shared:
+        # Shared across the FastAPI and Streamlit threads; transactions are
+        # managed explicitly (isolation_level=None) under _WRITE_LOCK. The larger
+        # statement cache keeps every query this module issues compiled
+        target, uri = (f"file:{DB_PATH}?mode=ro", True) if readonly else (DB_PATH, False)
+        conn = sqlite3.connect(target, uri=uri, timeout=BUSY_TIMEOUT, check_same_thread=False, isolation_level=None, cached_statements=STATEMENT_CACHE_SIZE)
+    else:
+        conn = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT)
+    if DB_PATH != ":memory:":
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+    return conn
+
+@contextmanager
+def write_transaction(begin="BEGIN"):
+    with _WRITE_LOCK:
+        _CONN.execute(begin)
+        try:
+            yield _CONN
+        except BaseException:
+            _CONN.execute("ROLLBACK")
+            raise
+        _CONN.execute("COMMIT")
+
+def now_ms():
+    # Reading timestamps are integer epoch milliseconds (UTC)
+    return time.time_ns() // 1_000_000
+
+def split_value(value):
+    # (value_num, value_text) pair for a reading. NaN and infinities are kept
+    # as text: SQLite stores a NaN REAL as NULL, which would lose the reading
+    try:
+        num = float(value)
+    except (TypeError, ValueError):
+        return None, str(value)
+    if not math.isfinite(num):
+        return None, str(value)
+    return num, None
+
+def init_db():
+    conn = connect()
+    c = conn.cursor()
+    if DB_PATH != ":memory:":
+        # WAL lets dashboard readers run alongside the ingest writer.
+        # Changing page_size later requires leaving WAL first:
+        # journal_mode=DELETE; page_size=8192; VACUUM; journal_mode=WAL
+        c.execute("PRAGMA journal_mode=WAL")
+    # Check if sensor_data table exists and has channelId column
+    c.execute("PRAGMA table_info(sensor_data)")
+    columns = [row[1] for row in c.fetchall()]
+    if 'channelId' not in columns:
+        c.execute("DROP TABLE IF EXISTS sensor_data")
+    elif 'ts' not in columns:
+        # Earlier schemas stored a DATETIME text timestamp (and, before that,
+        # every reading as TEXT); rows are moved over below
+        c.execute("ALTER TABLE sensor_data RENAME TO sensor_data_old")
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS channels (
+            channelId TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            fields TEXT NOT NULL -- comma separated field names
+        )
+    """)
+    # One row per (channel, field), used to validate ingest without splitting
+    # channels.fields
+    c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='channel_fields'")
+    backfill = c.fetchone() is None
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS channel_fields (
+            channelId TEXT NOT NULL,
+            field TEXT NOT NULL,
+            PRIMARY KEY (channelId, field)
+        )
+    """)
+    if backfill:
+        c.executemany(
+            CHANNEL_FIELD_STMT,
+            [ (cid, f) for cid, fields in c.execute("SELECT channelId, fields FROM channels").fetchall() for f in fields.split(',') ]
+        )
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS sensor_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channelId TEXT NOT NULL,
+            field TEXT NOT NULL,
+            value_num REAL, -- numeric readings
+            value_text TEXT, -- anything that doesn't parse as a number
+            ts INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)) -- epoch ms
+        )
+    """)
+    if 'channelId' in columns and 'ts' not in columns:
+        old_ts = "CAST(strftime('%s', timestamp) AS INTEGER) * 1000"
+        if 'value' in columns:
+            rows = c.execute(f"SELECT id, channelId, field, value, {old_ts} FROM sensor_data_old").fetchall()
+            c.executemany(
+                "INSERT INTO sensor_data (id, channelId, field, value_num, value_text, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                ((i, cid, f, *split_value(v), ts) for i, cid, f, v, ts in rows)
+            )
+        else:
+            c.execute(
+                "INSERT INTO sensor_data (id, channelId, field, value_num, value_text, ts) "
+                f"SELECT id, channelId, field, value_num, value_text, {old_ts} FROM sensor_data_old"
+            )
+        c.execute("DROP TABLE sensor_data_old")
+    # Range scans for per-channel and per-field reads ordered by time
+    c.execute("CREATE INDEX IF NOT EXISTS idx_sd_channel_ts ON sensor_data(channelId, ts)")
+    # Chart reads are served from this index alone: it keeps each channel's
+    # readings contiguous and carries value_num, so the interleaved table rows
+    # are never touched
+    c.execute("DROP INDEX IF EXISTS idx_sd_channel_field_ts")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_sd_channel_field_ts_num ON sensor_data(channelId, field, ts, value_num)")
+    conn.commit()
+    # Gather planner statistics once; PRAGMA optimize keeps them fresh afterwards
+    c.execute("SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'")
+    if c.fetchone() is None:
+        c.execute("ANALYZE")
+        conn.commit()
+    conn.close()
+
+def create_channel(channelId, name, fields):
+    # IMMEDIATE takes the write lock up front, and OR IGNORE turns a duplicate
+    # channelId (including one created by another API process) into rowcount 0
+    with write_transaction("BEGIN IMMEDIATE") as conn:
+        if not conn.execute("INSERT OR IGNORE INTO channels (channelId, name, fields) VALUES (?, ?, ?)", (channelId, name, ','.join(fields))).rowcount:
+            return False, "Channel already exists"
+        conn.executemany(CHANNEL_FIELD_STMT, [ (channelId, f) for f in fields ])
+    _ALLOWED_FIELDS[channelId] = frozenset(fields)
+    _MISSING_CHANNELS.pop(channelId, None)
+    return True, "Channel created"
+
+def get_channels():
+    # (channelId, name, [fields]) with fields read from channel_fields in the
+    # order they were declared, instead of splitting channels.fields
+    with _READ_LOCK:
+        channels = _READ_CONN.execute("SELECT channelId, name FROM channels").fetchall()
+        rows = _READ_CONN.execute("SELECT channelId, field FROM channel_fields ORDER BY channelId, rowid").fetchall()
+    fields = {cid: [f for _, f in group] for cid, group in groupby(rows, key=itemgetter(0))}
+    return [ (cid, name, fields.get(cid, [])) for cid, name in channels ]
+
+def fields_cached(channelId):
+    # True when allowed_fields() can answer without querying SQLite
+    return channelId in _ALLOWED_FIELDS or _MISSING_CHANNELS.get(channelId, 0) > time.monotonic()
+
+def allowed_fields(channelId):
+    fields = _ALLOWED_FIELDS.get(channelId)
+    if fields is None:
+        if _MISSING_CHANNELS.get(channelId, 0) > time.monotonic():
+            return None
+        with _READ_LOCK:
+            rows = _READ_CONN.execute(CHANNEL_STMT, (channelId,)).fetchall()
+        if not rows:
+            if len(_MISSING_CHANNELS) >= MISSING_CACHE_SIZE:
+                _MISSING_CHANNELS.clear()
+            _MISSING_CHANNELS[channelId] = time.monotonic() + MISSING_TTL
+            return None
+        fields = _ALLOWED_FIELDS[channelId] = frozenset(r[0] for r in rows)
+    return fields
+
+def validate_data(channelId, data_list):
+    # Returns an error message, or None if every field belongs to the channel
+    allowed = allowed_fields(channelId)
+    if allowed is None:
+        return "Channel does not exist"
+    # One set difference against the cached field set; the loop below only
+    # runs to name the first offending field
+    unknown = {d["field"] for d in data_list} - allowed
+    if unknown:
+        field = next(d["field"] for d in data_list if d["field"] in unknown)
+        return f"Field {field} not allowed in channel {channelId}"
+    return None
+
+def insert_rows(conn, rows):
+    # rows may be any iterable; it's consumed one chunk at a time so a large
+    # generator is never materialized. Full chunks go through the multi-row
+    # statement, the remainder through executemany
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, MULTI_INSERT_ROWS))
+        if len(chunk) < MULTI_INSERT_ROWS:
+            if chunk:
+                conn.executemany(INSERT_STMT, chunk)
+            return
+        conn.execute(MULTI_INSERT_STMT, list(chain.from_iterable(chunk)))
+
+def enqueue_data(channelId, data_list):
+    # Checked by validate_data now; the rows are written later by flush_buffer
+    error = validate_data(channelId, data_list)
+    if error:
+        return False, error
+    # Stamped on arrival, not when the flusher gets to them, unless the
+    # device sent its own epoch-ms "ts"
+    ts = now_ms()
+    _BUFFER.extend((channelId, d["field"], *split_value(d["value"]), ts if d.get("ts") is None else d["ts"]) for d in data_list)
+    return True, "Data queued"
+
+def buffered_rows():
+    return len(_BUFFER)
+
+def flush_buffer(max_rows=FLUSH_MAX_ROWS):
+    rows = []
+    while _BUFFER and len(rows) < max_rows:
+        rows.append(_BUFFER.popleft())
+    if rows:
+        try:
+            with write_transaction("BEGIN IMMEDIATE") as conn:
+                insert_rows(conn, rows)
+        except Exception:
+            # Put the batch back in its original order so the next flush retries it
+            _BUFFER.extendleft(reversed(rows))
+            raise
+    return len(rows)
+
+def fetch_rows(channelId):
+    # Plain (channelId, field, value, timestamp) tuples, oldest first, for
+    # callers that don't need a DataFrame
+    with _READ_LOCK:
+        return _READ_CONN.execute(DATA_QUERY + " WHERE channelId=? ORDER BY ts ASC", (channelId,)).fetchall()
+
+def fetch_data(channelId=None):
+    query = DATA_QUERY
+    params = ()
+    if channelId:
+        query += " WHERE channelId=?"
+        params = (channelId,)
+    with _READ_LOCK:
+        if channelId:
+            # Rows are append-only, so the newest id tells us whether the
+            # cached frame for this channel is still current
+            max_id = _READ_CONN.execute("SELECT MAX(id) FROM sensor_data WHERE channelId=?", params).fetchone()[0]
+            cached = _DF_CACHE.get(channelId)
+            if cached and cached[0] == max_id:
+                _DF_CACHE.move_to_end(channelId)
+                return cached[1].copy()
+        rows = _READ_CONN.execute(query + " ORDER BY ts ASC", params).fetchall()
+        df = pd.DataFrame.from_records(rows, columns=DATA_COLUMNS)
+        if channelId:
+            _DF_CACHE[channelId] = (max_id, df)
+            _DF_CACHE.move_to_end(channelId)
+            if len(_DF_CACHE) > DF_CACHE_SIZE:
+                _DF_CACHE.popitem(last=False)
+            return df.copy()
+    return df
+
+def fetch_pivoted(channelId, fields, since=None, points=RESOLUTIONS["Medium"]):
+    # One row per time bucket with a column per requested field, pivoted in
+    # SQL. `since` is a window length in seconds, counted back from now. The
+    # window is split into at most `points` equal buckets and readings are
+    # averaged within each, so chart size stays bounded however long the history.
+    where = "WHERE channelId=?"
+    params = [channelId]
+    if since:
+        where += " AND ts >= ?"
+        params.append(now_ms() - since * 1000)
+    with _READ_LOCK:
+        lo, hi = _READ_CONN.execute(
+            f"SELECT (SELECT MIN(ts) FROM sensor_data {where}), (SELECT MAX(ts) FROM sensor_data {where})",
+            params * 2
+        ).fetchone()
+    if lo is None:
+        return pd.DataFrame(columns=list(fields), dtype="float64")
+    bucket = max(1, -(-(hi - lo + 1) // points))
+    columns = ", ".join("AVG(CASE WHEN field=? THEN value_num END)" for _ in fields)
+    placeholders = ",".join("?" * len(fields))
+    query = (
+        f"SELECT ? + (ts - ?) / ? * ? AS bucket, {columns} FROM sensor_data "
+        f"{where} AND field IN ({placeholders}) GROUP BY bucket ORDER BY bucket ASC"
+    )
+    with _READ_LOCK:
+        rows = _READ_CONN.execute(query, [lo, lo, bucket, bucket, *fields, *params, *fields]).fetchall()
+    df = pd.DataFrame.from_records(rows, columns=["timestamp", *fields])
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    return df.set_index("timestamp").astype("float64")
+
+def maintain(checkpoint=False):
+    # Refresh planner statistics and optionally truncate the WAL file
+    with _WRITE_LOCK:
+        _CONN.execute("PRAGMA optimize")
+        if checkpoint:
+            _CONN.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+init_db()
+
+# One writer connection plus a separate reader so dashboard queries don't
+# contend with the FastAPI ingest path (WAL allows both at once)
+_CONN = connect(shared=True)
+_READ_CONN = connect(shared=True, readonly=True) if DB_PATH != ":memory:" else _CONN
+_WRITE_LOCK = threading.Lock()
+_READ_LOCK = _WRITE_LOCK if _READ_CONN is _CONN else threading.Lock()
+
+# Preload every channel's allowed fields so ingest never has to query them
+for cid, rows in groupby(_READ_CONN.execute("SELECT channelId, field FROM channel_fields ORDER BY channelId").fetchall(), key=itemgetter(0)):
+    _ALLOWED_FIELDS[cid] = frozenset(f for _, f in rows)
+
@@ -0,0 +1,234 @@
+# FastAPI ingest/query API. Runs on its own with
+#   python iot_api.py
+# as a single process by default, so one flusher is the only SQLite writer;
+# WEB_CONCURRENCY=N runs N worker processes, each with its own buffer and
+# flusher contending for the database lock. Also runs under gunicorn, e.g.
+#   gunicorn -k uvicorn.workers.UvicornWorker -w 1 iot_api:app
+# The Streamlit dashboard (app.py) embeds it in a thread unless IOT_EMBED_API=0.
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+import anyio
+from fastapi import FastAPI, Request, Query, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, field_validator
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+import uvicorn
+from db import (
+    create_channel, get_channels, enqueue_data, flush_buffer, buffered_rows,
+    fields_cached, fetch_rows, maintain, now_ms, FLUSH_MAX_ROWS, DATA_COLUMNS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Ingest buffer flushing, and background maintenance: planner stats refresh
+# and WAL truncation
+FLUSH_INTERVAL = 0.25
+OPTIMIZE_INTERVAL = 15 * 60
+CHECKPOINT_INTERVAL = 60 * 60
+# Worker threads for blocking SQLite calls (sync handlers, flushes); anyio's
+# default is 40
+THREADPOOL_SIZE = 128
+# Readings held in the buffer before /api/data starts rejecting with 503
+BUFFER_MAX_ROWS = 100_000
+# Largest accepted /api/data/batch body; devices should send 100-1000 rows
+BATCH_MAX_ROWS = 5000
+# Request limits: per device+channel on ingest, per IP across all ingest.
+# The ingest limits are shared by /api/data and /api/data/batch, so
+# switching endpoints doesn't reset either budget
+CHANNEL_CREATE_LIMIT = "10/minute"
+INGEST_CHANNEL_LIMIT = "50/minute"
+INGEST_IP_LIMIT = "300/minute"
+# Accepted device timestamps, relative to the server clock: a little clock
+# skew ahead, and up to IOT_TS_MAX_AGE_DAYS of readings buffered offline
+TS_MAX_AHEAD_MS = 5 * 60 * 1000
+TS_MAX_AGE_MS = int(os.getenv("IOT_TS_MAX_AGE_DAYS", 30)) * 24 * 3600 * 1000
+
+async def flusher():
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL)
+        # Commits run off the event loop so requests keep being served. A
+        # failed flush leaves its rows in the buffer; log it and retry on the
+        # next tick rather than letting the task die
+        try:
+            while await run_in_threadpool(flush_buffer) == FLUSH_MAX_ROWS:
+                pass
+        except Exception:
+            logger.exception("Flushing the ingest buffer failed, will retry")
+
+async def maintenance():
+    elapsed = 0
+    while True:
+        await asyncio.sleep(OPTIMIZE_INTERVAL)
+        elapsed += OPTIMIZE_INTERVAL
+        checkpoint = elapsed >= CHECKPOINT_INTERVAL
+        await run_in_threadpool(maintain, checkpoint)
+        if checkpoint:
+            elapsed = 0
+
+@asynccontextmanager
+async def lifespan(app):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    tasks = [asyncio.create_task(flusher()), asyncio.create_task(maintenance())]
+    yield
+    for task in tasks:
+        task.cancel()
+    while flush_buffer():
+        pass
+    maintain()
+
+# Ingest is limited per device and channel, so one misbehaving device can't
+# use up the budget of every channel behind the same address, and also per
+# IP (INGEST_IP_LIMIT), so a client can't dodge the channel limit by varying
+# channelId. The batch endpoint carries channelId in its body, which
+# batch_payload stashes on request.state
+def channel_key(request):
+    channelId = request.query_params.get("channelId") or getattr(request.state, "channelId", "")
+    return f"{get_remote_address(request)}:{channelId}"
+
+# FastAPI setup with rate limiting
+limiter = Limiter(key_func=get_remote_address)
+app = FastAPI(lifespan=lifespan)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+# limiter.limit() counts each route separately; a shared limit with a fixed
+# scope makes both ingest routes draw on the same budgets
+ingest_channel_limit = limiter.shared_limit(INGEST_CHANNEL_LIMIT, scope="ingest_channel", key_func=channel_key)
+ingest_ip_limit = limiter.shared_limit(INGEST_IP_LIMIT, scope="ingest_ip")
+
+
+# Request body for /api/channel, parsed and type-checked by FastAPI
+class ChannelPayload(BaseModel):
+    channelId: str
+    name: str
+    fields: list[str]
+
+# Handlers that touch SQLite are plain def, so FastAPI runs them in its
+# threadpool instead of blocking the event loop. The ingest handlers stay
+# async and go through queue_data, which only leaves the loop when
+# validation would have to query SQLite
+
+async def queue_data(channelId, data_list):
+    # A channel seen for the first time (or after its miss expired) is looked
+    # up in the threadpool; known and recently-missing channels are answered
+    # from memory
+    if fields_cached(channelId):
+        return enqueue_data(channelId, data_list)
+    return await run_in_threadpool(enqueue_data, channelId, data_list)
+
+# API to create a channel
+@app.post("/api/channel")
+@limiter.limit(CHANNEL_CREATE_LIMIT)
+def api_create_channel(request: Request, payload: ChannelPayload):
+    if not payload.channelId or not payload.name or not payload.fields:
+        return JSONResponse({"error": "Missing or invalid channelId, name, or fields (must be a list)"}, status_code=400)
+    success, msg = create_channel(payload.channelId, payload.name, payload.fields)
+    if not success:
+        return JSONResponse({"error": msg}, status_code=400)
+    return {"status": "success", "message": msg}
+
+# API to get channels
+@app.get("/api/channels")
+def api_get_channels():
+    rows = get_channels()
+    return {"channels": [ {"channelId": r[0], "name": r[1], "fields": r[2]} for r in rows ]}
+
+
+def legacy_query_pairs(params):
+    # field1..field5 / value1..value5, the original ESP8266/AT query format
+    data_list = []
+    for i in range(1, 6):
+        f, v = params.get(f"field{i}"), params.get(f"value{i}")
+        if f and v is not None:
+            data_list.append({"field": f, "value": v})
+    return data_list
+
+# API to insert data via query params (GET for ESP8266/AT compatibility)
+# e.g. /api/data?channelId=ch1&fields=temperature,humidity&values=25.5,40
+@app.get("/api/data", status_code=202)
+@ingest_channel_limit
+@ingest_ip_limit
+async def receive_data_query(
+    request: Request,
+    channelId: str = Query(...),
+    fields: str = Query(None),
+    values: str = Query(None)
+):
+    if fields is not None and values is not None:
+        names, vals = fields.split(","), values.split(",")
+        if len(names) != len(vals):
+            return JSONResponse({"error": "fields and values must have the same length"}, status_code=400)
+        data_list = [ {"field": f, "value": v} for f, v in zip(names, vals) ]
+    else:
+        data_list = legacy_query_pairs(request.query_params)
+    if not channelId or not data_list:
+        return JSONResponse({"error": "Missing channelId or data"}, status_code=400)
+    if buffered_rows() >= BUFFER_MAX_ROWS:
+        return JSONResponse({"error": "Ingest buffer full, retry later"}, status_code=503)
+    success, msg = await queue_data(channelId, data_list)
+    if not success:
+        return JSONResponse({"error": msg}, status_code=400)
+    return {"status": "success", "message": msg, "count": len(data_list)}
+
+# Request body for /api/data/batch; ts is optional epoch milliseconds
+class BatchRow(BaseModel):
+    field: str
+    value: float | str
+    ts: int | None = None
+
+    # A reading far from now (a bad device clock, or epoch seconds) would
+    # stretch the chart time buckets for the whole channel; reject it with 422
+    @field_validator("ts")
+    @classmethod
+    def ts_near_now(cls, ts):
+        if ts is not None:
+            now = now_ms()
+            if not now - TS_MAX_AGE_MS <= ts <= now + TS_MAX_AHEAD_MS:
+                raise ValueError("ts must be epoch milliseconds within the accepted window around the server time")
+        return ts
+
+class BatchPayload(BaseModel):
+    channelId: str
+    rows: list[BatchRow]
+
+def batch_payload(request: Request, payload: BatchPayload):
+    request.state.channelId = payload.channelId
+    return payload
+
+# API to insert many readings in one request, for devices that can buffer
+# e.g. {"channelId": "ch1", "rows": [{"field": "temperature", "value": 25.5}, ...]}
+@app.post("/api/data/batch", status_code=202)
+@ingest_channel_limit
+@ingest_ip_limit
+async def receive_data_batch(request: Request, payload: BatchPayload = Depends(batch_payload)):
+    if not payload.channelId or not payload.rows:
+        return JSONResponse({"error": "Missing channelId or data"}, status_code=400)
+    if len(payload.rows) > BATCH_MAX_ROWS:
+        return JSONResponse({"error": f"At most {BATCH_MAX_ROWS} rows per batch"}, status_code=400)
+    if buffered_rows() >= BUFFER_MAX_ROWS:
+        return JSONResponse({"error": "Ingest buffer full, retry later"}, status_code=503)
+    success, msg = await queue_data(payload.channelId, [ r.model_dump() for r in payload.rows ])
+    if not success:
+        return JSONResponse({"error": msg}, status_code=400)
+    return {"status": "success", "message": msg, "count": len(payload.rows)}
+
+# API to get data by channelId
+@app.get("/api/data/{channelId}")
+def api_get_data(channelId: str):
+    return {"data": [ dict(zip(DATA_COLUMNS, r)) for r in fetch_rows(channelId) ]}
+
+# Single in-process server, used when the dashboard embeds the API
+def run_api():
+    config = uvicorn.Config(app, host="0.0.0.0", port=8000, access_log=False)
+    uvicorn.Server(config).run()
+
+if __name__ == "__main__":
+    # One worker by default: every extra worker is another process with its
+    # own ingest buffer and flusher taking SQLite's single write lock, so only
+    # raise WEB_CONCURRENCY if request handling, not writing, is the bottleneck
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    uvicorn.run("iot_api:app", host="0.0.0.0", port=8000, workers=workers, access_log=False)
@@ -0,0 +1,53 @@
+# Rate-limit and validation checks for the ingest API; run with python -m pytest
+import os
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    # db opens iot_data.db relative to the working directory at import
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("db"))
+    import iot_api
+    with TestClient(iot_api.app) as client:
+        client.post("/api/channel", json={"channelId": "ch1", "name": "Room1", "fields": ["temperature"]})
+        yield iot_api, client
+    os.chdir(cwd)
+
+
+@pytest.fixture
+def client(api):
+    iot_api, client = api
+    iot_api.limiter.reset()
+    return client
+
+
+def get_reading(client, channelId):
+    return client.get("/api/data", params={"channelId": channelId, "fields": "temperature", "values": "25.5"})
+
+
+def post_batch(client, channelId):
+    return client.post("/api/data/batch", json={"channelId": channelId, "rows": [{"field": "temperature", "value": 25.5}]})
+
+
+def test_channel_limit_shared_across_ingest_routes(client):
+    for _ in range(50):
+        assert get_reading(client, "ch1").status_code == 202
+    assert post_batch(client, "ch1").status_code == 429
+    # other channels behind the same address keep their own budget
+    assert post_batch(client, "ch2").status_code != 429
+
+
+def test_ip_limit_shared_across_ingest_routes(client):
+    for i in range(300):
+        assert get_reading(client, f"ch{i % 10 + 2}").status_code != 429
+    assert post_batch(client, "other").status_code == 429
+
+
+def test_batch_ts_outside_window_rejected(api, client):
+    iot_api = api[0]
+    now = iot_api.now_ms()
+    for ts, status in [(now, 202), (now // 1000, 422), (now + iot_api.TS_MAX_AHEAD_MS + 60_000, 422), (now - iot_api.TS_MAX_AGE_MS - 60_000, 422)]:
+        rows = [{"field": "temperature", "value": 25.5, "ts": ts}]
+        assert client.post("/api/data/batch", json={"channelId": "ch1", "rows": rows}).status_code == status